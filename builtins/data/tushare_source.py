@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import os
 from datetime import date, datetime
+from operator import itemgetter
+from pathlib import Path
 from typing import Any, cast
 
-from core.cache import CacheManager, MemoryCache
+from core.cache import CacheBackend, CacheManager, FileCache, MemoryCache, TieredCache
 from plugins.base import Plugin
 
 try:
@@ -18,6 +20,11 @@ try:
 except ImportError:  # pragma: no cover - tests patch module-level ts directly
     ts = None
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas ships with tushare
+    pd = None
+
 
 class TushareDataSource(Plugin):
     """Tushare 数据源插件，作为 AKShare 备用源。"""
@@ -26,7 +33,11 @@ class TushareDataSource(Plugin):
     version = "1.0.0"
     description = "Tushare data source for A-share and convertible bond"
 
-    def __init__(self) -> None:
+    # Per-endpoint TTLs; bumped to one day when a persistent disk tier is on.
+    _list_ttl: float = 300.0
+    _history_ttl: float = 300.0
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
         super().__init__()
         token = os.getenv("TUSHARE_TOKEN", "").strip()
         if not token:
@@ -37,7 +48,13 @@ class TushareDataSource(Plugin):
 
         ts.set_token(token)
         self._pro = ts.pro_api()
-        self._cache = CacheManager(MemoryCache())
+
+        backend: CacheBackend = MemoryCache()
+        if cache_dir is not None:
+            backend = TieredCache(backend, FileCache(Path(cache_dir) / "tushare"))
+            self._list_ttl = 86400.0
+            self._history_ttl = 86400.0
+        self._cache = CacheManager(backend)
 
     # ----- protocol compatibility -----
     def fetch_bars(self, symbol: str, start: date, end: date) -> list[dict[str, Any]]:
@@ -52,6 +69,11 @@ class TushareDataSource(Plugin):
     # ----- day15 required APIs -----
     def fetch_stock_list(self) -> list[dict[str, Any]]:
         """获取股票列表。"""
+        key = self._cache.cache_key("ts_stock_list")
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -70,9 +92,9 @@ class TushareDataSource(Plugin):
             except Exception as exc:  # noqa: BLE001
                 raise self._map_exception("fetch_stock_list", exc) from exc
 
-        key = self._cache.cache_key("ts_stock_list")
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=300.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._list_ttl),
         )
 
     def fetch_stock_history(
@@ -82,6 +104,11 @@ class TushareDataSource(Plugin):
         end: date,
     ) -> list[dict[str, Any]]:
         """获取股票历史数据，格式与 AKShare 标准化输出一致。"""
+        key = self._cache.cache_key("ts_stock_history", symbol, start, end)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -90,21 +117,128 @@ class TushareDataSource(Plugin):
                     start_date=start.strftime("%Y%m%d"),
                     end_date=end.strftime("%Y%m%d"),
                 )
-                rows = self._to_records(frame)
-                if not rows:
+                bars = self._normalize_frame(frame, symbol)
+                if bars is None:
+                    rows = self._to_records(frame)
+                    bars = sorted(
+                        (self._normalize_bar(row, symbol) for row in rows),
+                        key=itemgetter("datetime"),
+                    )
+                if not bars:
                     raise RuntimeError("no data")
-                bars = [self._normalize_bar(row, symbol) for row in rows]
-                return sorted(bars, key=lambda x: cast(datetime, x["datetime"]))
+                return bars
             except Exception as exc:  # noqa: BLE001
                 raise self._map_exception("fetch_stock_history", exc) from exc
 
-        key = self._cache.cache_key("ts_stock_history", symbol, start, end)
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=300.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._history_ttl),
         )
 
+    def fetch_stock_history_many(
+        self,
+        symbols: list[str],
+        start: date,
+        end: date,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """批量获取多只股票历史数据，合并为一次 ``pro.daily`` 调用。
+
+        Results are cached per ``(symbol, start, end)`` with the same keys as
+        :meth:`fetch_stock_history`, so warm symbols skip the RPC entirely.
+        """
+        results: dict[str, list[dict[str, Any]]] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            key = self._cache.cache_key("ts_stock_history", symbol, start, end)
+            cached = self._cache.backend.get(key)
+            if cached is not None:
+                results[symbol] = cast(list[dict[str, Any]], cached)
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return results
+
+        code_to_symbol = {self._to_tushare_code(s): s for s in missing}
+        try:
+            frame = self._pro.daily(
+                ts_code=",".join(code_to_symbol),
+                start_date=start.strftime("%Y%m%d"),
+                end_date=end.strftime("%Y%m%d"),
+            )
+            rows = self._to_records(frame)
+        except Exception as exc:  # noqa: BLE001
+            raise self._map_exception("fetch_stock_history_many", exc) from exc
+
+        grouped: dict[str, list[dict[str, Any]]] = {s: [] for s in missing}
+        for row in rows:
+            symbol = code_to_symbol.get(str(row.get("ts_code", "")))
+            if symbol is not None:
+                grouped[symbol].append(self._normalize_bar(row, symbol))
+
+        for symbol, bars in grouped.items():
+            # 空结果不写缓存也不返回：单只路径对 no data 抛
+            # RuntimeError，把 [] 固化成缓存命中会改写这一契约
+            if not bars:
+                continue
+            bars.sort(key=itemgetter("datetime"))
+            key = self._cache.cache_key("ts_stock_history", symbol, start, end)
+            self._cache.backend.set(key, bars, self._history_ttl)
+            results[symbol] = bars
+
+        return results
+
+    def fetch_stock_history_frame(self, symbol: str, start: date, end: date) -> Any:
+        """获取股票历史数据，返回标准化 DataFrame（列式，不物化字典）。
+
+        For large multi-year pulls this keeps data in contiguous columns end
+        to end; callers that need the legacy shape can still use
+        :meth:`fetch_stock_history`.
+        """
+        if pd is None:
+            raise RuntimeError("pandas is required for frame-based history")
+
+        def _factory() -> Any:
+            try:
+                frame = self._pro.daily(
+                    ts_code=self._to_tushare_code(symbol),
+                    start_date=start.strftime("%Y%m%d"),
+                    end_date=end.strftime("%Y%m%d"),
+                )
+                if not isinstance(frame, pd.DataFrame) or frame.empty:
+                    raise RuntimeError("no data")
+
+                ordered = frame.sort_values("trade_date")
+                vol_col = "vol" if "vol" in ordered.columns else "volume"
+                return pd.DataFrame(
+                    {
+                        "symbol": symbol,
+                        "datetime": pd.to_datetime(
+                            ordered["trade_date"].to_numpy(),
+                            format="%Y%m%d",
+                            cache=True,
+                        ),
+                        "open": ordered["open"].astype("float64").to_numpy(),
+                        "high": ordered["high"].astype("float64").to_numpy(),
+                        "low": ordered["low"].astype("float64").to_numpy(),
+                        "close": ordered["close"].astype("float64").to_numpy(),
+                        "volume": ordered[vol_col].astype("int64").to_numpy(),
+                        "amount": ordered["amount"].astype("float64").to_numpy(),
+                    }
+                )
+            except Exception as exc:  # noqa: BLE001
+                raise self._map_exception("fetch_stock_history_frame", exc) from exc
+
+        key = self._cache.cache_key("ts_stock_history_frame", symbol, start, end)
+        return self._cache.get_or_set(key, _factory, ttl=self._history_ttl)
+
     def fetch_cb_list(self) -> list[dict[str, Any]]:
         """获取可转债列表。"""
+        key = self._cache.cache_key("ts_cb_list")
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -121,9 +255,9 @@ class TushareDataSource(Plugin):
             except Exception as exc:  # noqa: BLE001
                 raise self._map_exception("fetch_cb_list", exc) from exc
 
-        key = self._cache.cache_key("ts_cb_list")
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=300.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._list_ttl),
         )
 
     def fetch_cb_history(
@@ -133,6 +267,11 @@ class TushareDataSource(Plugin):
         end: date,
     ) -> list[dict[str, Any]]:
         """获取可转债历史数据，格式与 AKShare 标准化输出一致。"""
+        key = self._cache.cache_key("ts_cb_history", symbol, start, end)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -141,22 +280,35 @@ class TushareDataSource(Plugin):
                     start_date=start.strftime("%Y%m%d"),
                     end_date=end.strftime("%Y%m%d"),
                 )
-                rows = self._to_records(frame)
-                if not rows:
+                bars = self._normalize_frame(frame, symbol)
+                if bars is None:
+                    rows = self._to_records(frame)
+                    bars = sorted(
+                        (self._normalize_bar(row, symbol) for row in rows),
+                        key=itemgetter("datetime"),
+                    )
+                if not bars:
                     raise RuntimeError("no data")
-                bars = [self._normalize_bar(row, symbol) for row in rows]
-                return sorted(bars, key=lambda x: cast(datetime, x["datetime"]))
+                return bars
             except Exception as exc:  # noqa: BLE001
                 raise self._map_exception("fetch_cb_history", exc) from exc
 
-        key = self._cache.cache_key("ts_cb_history", symbol, start, end)
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=300.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._history_ttl),
         )
 
     # ----- internals -----
     @staticmethod
     def _to_records(frame: Any) -> list[dict[str, Any]]:
+        columns = getattr(frame, "columns", None)
+        if columns is not None and hasattr(frame, "__getitem__"):
+            # Columnar fast path: pull each column as a flat array once and
+            # zip rows together, instead of letting pandas box every cell
+            # through to_dict(orient="records").
+            names = [str(col) for col in columns]
+            arrays = [frame[col].to_numpy().tolist() for col in columns]
+            return [dict(zip(names, row)) for row in zip(*arrays)]
         if hasattr(frame, "to_dict"):
             records = frame.to_dict(orient="records")
             if isinstance(records, list):
@@ -167,9 +319,56 @@ class TushareDataSource(Plugin):
     def _to_tushare_code(symbol: str) -> str:
         if "." in symbol:
             return symbol
-        if symbol.startswith(("6", "9")):
-            return f"{symbol}.SH"
-        return f"{symbol}.SZ"
+        if symbol[:1] in _SH_PREFIXES:
+            return symbol + ".SH"
+        return symbol + ".SZ"
+
+    @staticmethod
+    def _normalize_frame(frame: Any, symbol: str) -> list[dict[str, Any]] | None:
+        """Normalize a whole DataFrame in columnar batch operations.
+
+        Returns ``None`` when the input is not a real pandas DataFrame so
+        callers can fall back to per-row :meth:`_normalize_bar`.
+        """
+        if pd is None or not isinstance(frame, pd.DataFrame):
+            return None
+        if frame.empty:
+            return []
+        required = {"trade_date", "open", "high", "low", "close", "amount"}
+        if not required.issubset(frame.columns):
+            return None
+        if "vol" not in frame.columns and "volume" not in frame.columns:
+            return None
+
+        ordered = frame.sort_values("trade_date")
+        datetimes = pd.to_datetime(
+            ordered["trade_date"].to_numpy(), format="%Y%m%d", cache=True
+        ).to_pydatetime()
+
+        vol_col = "vol" if "vol" in ordered.columns else "volume"
+        ohlc = ordered[["open", "high", "low", "close", "amount"]].astype(
+            "float64", copy=False
+        )
+        opens, highs, lows, closes, amounts = (
+            ohlc[col].to_numpy() for col in ("open", "high", "low", "close", "amount")
+        )
+        volumes = ordered[vol_col].astype("float64", copy=False).to_numpy()
+
+        return [
+            {
+                "symbol": symbol,
+                "datetime": dt,
+                "open": float(o),
+                "high": float(h),
+                "low": float(lo),
+                "close": float(c),
+                "volume": int(v),
+                "amount": float(a),
+            }
+            for dt, o, h, lo, c, v, a in zip(
+                datetimes, opens, highs, lows, closes, volumes, amounts
+            )
+        ]
 
     @staticmethod
     def _normalize_bar(raw: dict[str, Any], symbol: str) -> dict[str, Any]:
@@ -191,6 +390,10 @@ class TushareDataSource(Plugin):
         if isinstance(value, date):
             return datetime.combine(value, datetime.min.time())
         if isinstance(value, str):
+            # Dominant tushare case is an 8-digit trade_date; slicing into
+            # int() avoids the strptime format machinery entirely.
+            if len(value) == 8 and value.isdigit():
+                return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
             for fmt in ("%Y%m%d", "%Y-%m-%d", "%Y/%m/%d"):
                 try:
                     return datetime.strptime(value, fmt)
@@ -201,10 +404,18 @@ class TushareDataSource(Plugin):
     @staticmethod
     def _map_exception(action: str, exc: Exception) -> RuntimeError:
         message = str(exc).lower()
-        if "429" in message or "too many" in message or "rate" in message:
-            return RuntimeError(f"{action} failed: rate limit")
-        if "timeout" in message or "network" in message or "connection" in message:
-            return RuntimeError(f"{action} failed: network error")
-        if "no data" in message or "empty" in message:
-            return RuntimeError(f"{action} failed: no data")
+        for label, needles in _ERROR_KEYWORD_TABLE:
+            if any(needle in message for needle in needles):
+                return RuntimeError(f"{action} failed: {label}")
         return RuntimeError(f"{action} failed")
+
+
+# Leading digits of Shanghai-exchange symbols; everything else maps to .SZ.
+_SH_PREFIXES = frozenset("69")
+
+# Keyword table scanned by _map_exception; first matching label wins.
+_ERROR_KEYWORD_TABLE: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("rate limit", ("429", "too many", "rate")),
+    ("network error", ("timeout", "network", "connection")),
+    ("no data", ("no data", "empty")),
+)
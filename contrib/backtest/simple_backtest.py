@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import math
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Literal
+from typing import Any, Literal, cast
 
 from core.config import FrameworkConfig
 from core.context import Context
@@ -16,8 +19,16 @@ from core.risk import RiskManager
 from plugins.base import Plugin
 from plugins.protocols import StrategyProtocol
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - stats fall back to pure Python
+    np = None
 
-@dataclass
+# Fields a dict signal must carry to skip order normalization entirely.
+_ORDER_FIELDS = frozenset({"symbol", "side", "quantity", "order_type"})
+
+
+@dataclass(slots=True)
 class BacktestResult:
     """回测结果。"""
 
@@ -65,8 +76,28 @@ class SimpleBacktestEngine(Plugin):
         self._portfolio: Portfolio | None = None
 
         self._latest_prices: dict[str, float] = {}
-        self._trades: list[dict[str, Any]] = []
-        self._net_value_series: list[dict[str, Any]] = []
+        # 持仓市值增量维护：始终等于 sum(qty * latest_price)，避免每 bar 全量重估
+        self._positions_value: float = 0.0
+        self._reset_series()
+
+    def _reset_series(self) -> None:
+        """Reset SoA storage for the net-value curve and trade records.
+
+        Both are stored column-wise (parallel typed arrays) and only
+        materialized into list[dict] when building :class:`BacktestResult`.
+        """
+        self._nv_dates: list[date | None] = []
+        self._nv_values: array[float] = array("d")
+        self._nv_len: int = 0
+
+        self._trade_dates: list[date] = []
+        self._trade_symbols: list[str] = []
+        self._trade_sides: list[str] = []
+        self._trade_quantities: array[int] = array("q")
+        self._trade_prices: array[float] = array("d")
+        self._trade_amounts: array[float] = array("d")
+        self._trade_commissions: array[float] = array("d")
+        self._trade_pnls: array[float] = array("d")
 
     def setup(self, context: Context) -> None:
         """Bind runtime context for this engine."""
@@ -80,20 +111,25 @@ class SimpleBacktestEngine(Plugin):
     def run(
         self,
         strategy: StrategyProtocol,
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any]],
         start_date: date,
         end_date: date,
     ) -> BacktestResult:
-        """Run backtest in [start_date, end_date]."""
-        from collections import defaultdict
+        """Run backtest in [start_date, end_date].
+
+        ``data`` is consumed in a single pass, so lazy generators work as
+        well as lists; only bars inside the date window are retained.
+        """
+        from itertools import groupby
+        from operator import itemgetter
 
         self._strategy = strategy
         self._portfolio = Portfolio(
             initial_cash=self.initial_cash, trade_mode=self.trade_mode
         )
         self._latest_prices = {}
-        self._trades = []
-        self._net_value_series = []
+        self._positions_value = 0.0
+        self._reset_series()
 
         context = Context(
             config=FrameworkConfig(),
@@ -107,22 +143,44 @@ class SimpleBacktestEngine(Plugin):
         if hasattr(strategy, "on_init"):
             strategy.on_init(context)
 
-        # 按日期聚合数据
-        daily_bars: dict[date, list[dict[str, Any]]] = defaultdict(list)
-        for bar in data:
-            bar_date = self._coerce_date(bar.get("date"))
-            if start_date <= bar_date <= end_date:
-                daily_bars[bar_date].append(bar)
+        # 解析日期、过滤区间，然后一次排序 + groupby 按日聚合
+        coerce_date = self._coerce_date
+        dated_bars = [
+            (bar_date, bar)
+            for bar in data
+            if start_date <= (bar_date := coerce_date(bar.get("date"))) <= end_date
+        ]
+        dated_bars.sort(key=itemgetter(0))
+
+        # 净值曲线每个交易日恰好一个点，长度已知，预分配避免多次扩容
+        day_count = len({bar_date for bar_date, _ in dated_bars})
+        self._nv_dates = [None] * day_count
+        self._nv_values = array("d", bytes(8 * day_count))
+
+        # 热路径属性提升为局部变量，避免每 bar 重复属性查找
+        latest_prices = self._latest_prices
+        portfolio = self._portfolio
+        settle_t1 = self.trade_mode == "T+1"
 
         # 按日期顺序处理
-        for bar_date in sorted(daily_bars.keys()):
-            day_bars = daily_bars[bar_date]
+        for bar_date, group in groupby(dated_bars, key=itemgetter(0)):
+            day_bars = [bar for _, bar in group]
 
-            # 更新最新价格
+            # 更新最新价格，并按价差增量调整持仓市值
+            # symbol 经 sys.intern 驻留：海量 bar 重复少量代码时，
+            # dict 查找退化为指针比较，且去重字符串对象
             for bar in day_bars:
-                symbol = str(bar.get("symbol", ""))
+                symbol = sys.intern(str(bar.get("symbol", "")))
                 if symbol:
-                    self._latest_prices[symbol] = float(bar.get("close", 0.0) or 0.0)
+                    close = float(bar.get("close", 0.0) or 0.0)
+                    previous = latest_prices.get(symbol)
+                    latest_prices[symbol] = close
+                    if previous is not None:
+                        position = portfolio.positions.get(symbol)
+                        if position is not None:
+                            self._positions_value += (
+                                close - previous
+                            ) * position.quantity
 
             # 构造聚合 bar，包含 cb_data
             aggregated_bar: dict[str, Any] = {
@@ -130,80 +188,149 @@ class SimpleBacktestEngine(Plugin):
                 "cb_data": day_bars,
             }
 
-            # 调用策略处理
-            self._process_bar(aggregated_bar)
+            # 调用策略处理（日期已在聚合时解析，不再重复 _coerce_date）
+            self._process_bar(aggregated_bar, bar_date)
 
             # T+1 日结算
-            if self.trade_mode == "T+1":
-                self._portfolio.settle_day(bar_date)
+            if settle_t1:
+                portfolio.settle_day(bar_date)
 
         result = self._calculate_stats()
         self.teardown(context)
         return result
 
-    def _process_bar(self, bar: dict[str, Any]) -> None:
+    def _process_bar(self, bar: dict[str, Any], bar_date: date | None = None) -> None:
         """Process one bar: strategy signal -> order match -> account update."""
         if self._context is None or self._portfolio is None or self._strategy is None:
             raise RuntimeError("engine not initialized")
 
-        bar_date = self._coerce_date(bar.get("date"))
+        if bar_date is None:
+            bar_date = self._coerce_date(bar.get("date"))
 
         raw_signals = self._strategy.on_bar(self._context, bar)
         orders = self._normalize_orders(raw_signals)
 
+        # 热路径属性提升为局部变量
+        portfolio = self._portfolio
+        commission_rate = self.commission_rate
+
         for order in orders:
             # 使用 _latest_prices 撮合，不依赖单条 bar
-            trade = self._match_order_v2(order, bar_date)
-            if trade is None:
+            matched = self._match_order_v2(order)
+            if matched is None:
                 continue
 
-            amount = float(trade["amount"])
-            commission = self._calculate_commission(amount)
+            symbol, side, quantity, price, amount = matched
+            # 手续费直接内联相乘（_calculate_commission 仅保留为公共入口）
+            commission = amount * commission_rate
 
-            side = str(trade["side"])
             if side == "BUY":
-                if amount + commission > self._portfolio.cash:
+                if amount + commission > portfolio.cash:
                     continue
-                self._portfolio.buy(
-                    symbol=str(trade["symbol"]),
-                    quantity=int(trade["quantity"]),
-                    price=float(trade["price"]),
-                    date=bar_date,
+                portfolio.buy(
+                    symbol=symbol, quantity=quantity, price=price, date=bar_date
                 )
-                self._portfolio.cash -= commission
-                trade["commission"] = commission
-                trade["pnl"] = 0.0
-                self._trades.append(trade)
-                continue
+                portfolio.cash -= commission
+                # 新增持仓按最新收盘价计入市值增量
+                self._positions_value += quantity * self._latest_prices[symbol]
+                pnl = 0.0
+            else:
+                try:
+                    realized_pnl = portfolio.sell(
+                        symbol=symbol, quantity=quantity, price=price, date=bar_date
+                    )
+                except ValueError:
+                    continue
 
-            try:
-                realized_pnl = self._portfolio.sell(
-                    symbol=str(trade["symbol"]),
-                    quantity=int(trade["quantity"]),
-                    price=float(trade["price"]),
-                    date=bar_date,
-                )
-            except ValueError:
-                continue
+                portfolio.cash -= commission
+                self._positions_value -= quantity * self._latest_prices[symbol]
+                pnl = realized_pnl - commission
+
+            self._record_trade(
+                bar_date, symbol, side, quantity, price, amount, commission, pnl
+            )
 
-            self._portfolio.cash -= commission
-            trade["commission"] = commission
-            trade["pnl"] = realized_pnl - commission
-            self._trades.append(trade)
+        # 净值 = 现金 + 增量维护的持仓市值（等价于全量 get_total_value）
+        index = self._nv_len
+        if index < len(self._nv_values):
+            self._nv_dates[index] = bar_date
+            self._nv_values[index] = portfolio.cash + self._positions_value
+        else:
+            self._nv_dates.append(bar_date)
+            self._nv_values.append(portfolio.cash + self._positions_value)
+        self._nv_len = index + 1
 
-        value = self._portfolio.get_total_value(self._latest_prices)
-        self._net_value_series.append({"date": bar_date, "value": value})
+    def _record_trade(
+        self,
+        bar_date: date,
+        symbol: str,
+        side: str,
+        quantity: int,
+        price: float,
+        amount: float,
+        commission: float,
+        pnl: float,
+    ) -> None:
+        """Append one executed trade into the SoA trade columns."""
+        self._trade_dates.append(bar_date)
+        self._trade_symbols.append(symbol)
+        self._trade_sides.append(side)
+        self._trade_quantities.append(quantity)
+        self._trade_prices.append(price)
+        self._trade_amounts.append(amount)
+        self._trade_commissions.append(commission)
+        self._trade_pnls.append(pnl)
+
+    def _trades_as_dicts(self) -> list[dict[str, Any]]:
+        """Materialize SoA trade columns into the public list[dict] shape."""
+        return [
+            {
+                "date": trade_date,
+                "symbol": symbol,
+                "side": side,
+                "quantity": quantity,
+                "price": price,
+                "amount": amount,
+                "commission": commission,
+                "pnl": pnl,
+            }
+            for (
+                trade_date,
+                symbol,
+                side,
+                quantity,
+                price,
+                amount,
+                commission,
+                pnl,
+            ) in zip(
+                self._trade_dates,
+                self._trade_symbols,
+                self._trade_sides,
+                self._trade_quantities,
+                self._trade_prices,
+                self._trade_amounts,
+                self._trade_commissions,
+                self._trade_pnls,
+            )
+        ]
 
     def _match_order_v2(
-        self, order: dict[str, Any], bar_date: date
-    ) -> dict[str, Any] | None:
-        """Match order using latest prices (for aggregated bar mode)."""
-        symbol = str(order.get("symbol", ""))
+        self, order: dict[str, Any]
+    ) -> tuple[str, str, int, float, float] | None:
+        """Match order using latest prices (for aggregated bar mode).
+
+        Returns:
+            ``(symbol, side, quantity, price, amount)`` or ``None``.
+        """
+        symbol = sys.intern(str(order.get("symbol", "")))
         if not symbol:
             return None
 
+        # 直接等值比较（而非集合成员判断）：真实信号几乎总是这两个值
         side = str(order.get("side", "")).upper()
-        if side not in {"BUY", "SELL"}:
+        is_buy = side == "BUY"
+        if not is_buy and side != "SELL":
             return None
 
         # 从最新价格获取
@@ -214,11 +341,11 @@ class SimpleBacktestEngine(Plugin):
         # 处理 quantity=None 的情况（计算合适的数量）
         quantity = order.get("quantity")
         if quantity is None or quantity <= 0:
-            if side == "BUY" and self._portfolio:
+            if is_buy and self._portfolio:
                 # 买入：用可用资金的 1/N 计算（N=top_n）
                 available = self._portfolio.cash * 0.3  # 每只最多 30%
                 quantity = int(available / close_price)
-            elif side == "SELL" and self._portfolio:
+            elif self._portfolio:
                 # 卖出：全仓卖出
                 pos = self._portfolio.get_position(symbol)
                 quantity = pos.quantity if pos else 0
@@ -228,20 +355,12 @@ class SimpleBacktestEngine(Plugin):
             return None
 
         # 计算成交价（含滑点）
-        if side == "BUY":
+        if is_buy:
             trade_price = close_price * (1 + self.slippage)
         else:
             trade_price = close_price * (1 - self.slippage)
 
-        amount = trade_price * quantity
-        return {
-            "date": bar_date,
-            "symbol": symbol,
-            "side": side,
-            "quantity": quantity,
-            "price": trade_price,
-            "amount": amount,
-        }
+        return (symbol, side, quantity, trade_price, trade_price * quantity)
 
     def _match_order(
         self, order: dict[str, Any], bar: dict[str, Any]
@@ -253,7 +372,7 @@ class SimpleBacktestEngine(Plugin):
 
         side = str(order.get("side", "")).upper()
         quantity = int(order.get("quantity", 0) or 0)
-        if side not in {"BUY", "SELL"} or quantity <= 0:
+        if (side != "BUY" and side != "SELL") or quantity <= 0:
             return None
 
         order_type = str(order.get("order_type", "MARKET")).upper()
@@ -300,7 +419,7 @@ class SimpleBacktestEngine(Plugin):
 
     def _calculate_stats(self) -> BacktestResult:
         """Calculate backtest statistics from account curve and trades."""
-        if not self._net_value_series:
+        if self._nv_len == 0:
             return BacktestResult(
                 initial_cash=self.initial_cash,
                 final_value=self.initial_cash,
@@ -314,49 +433,54 @@ class SimpleBacktestEngine(Plugin):
                 trades=[],
             )
 
-        values = [float(item["value"]) for item in self._net_value_series]
+        nv_len = self._nv_len
+        values = self._nv_values[:nv_len]
+        nv_dates = self._nv_dates[:nv_len]
         final_value = values[-1]
         total_return = (final_value - self.initial_cash) / self.initial_cash
 
-        # 计算天数（兼容 date 对象和字符串）
-        first_date = self._net_value_series[0]["date"]
-        last_date = self._net_value_series[-1]["date"]
-        if isinstance(first_date, str):
-            first_date = self._coerce_date(first_date)
-        if isinstance(last_date, str):
-            last_date = self._coerce_date(last_date)
+        first_date = cast(date, nv_dates[0])
+        last_date = cast(date, nv_dates[-1])
         days = max((last_date - first_date).days, 1)
         annual_return = (1 + total_return) ** (365 / days) - 1
 
-        daily_returns: list[float] = []
-        for i in range(1, len(values)):
-            prev = values[i - 1]
-            curr = values[i]
-            if prev > 0:
-                daily_returns.append(curr / prev - 1)
-
-        sharpe_ratio = 0.0
-        if daily_returns:
-            mean_ret = sum(daily_returns) / len(daily_returns)
-            variance = sum((r - mean_ret) ** 2 for r in daily_returns) / len(
-                daily_returns
-            )
-            std = math.sqrt(variance)
-            if std > 0:
-                sharpe_ratio = mean_ret / std * math.sqrt(252)
-
-        peak = values[0]
-        max_drawdown = 0.0
-        for value in values:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak if peak > 0 else 0.0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-
-        sell_trades = [trade for trade in self._trades if trade.get("side") == "SELL"]
-        wins = [trade for trade in sell_trades if float(trade.get("pnl", 0.0)) > 0]
-        win_rate = (len(wins) / len(sell_trades)) if sell_trades else 0.0
+        if np is not None:
+            sharpe_ratio, max_drawdown = self._vector_stats(values)
+        else:
+            daily_returns: list[float] = []
+            for i in range(1, len(values)):
+                prev = values[i - 1]
+                curr = values[i]
+                if prev > 0:
+                    daily_returns.append(curr / prev - 1)
+
+            sharpe_ratio = 0.0
+            if daily_returns:
+                mean_ret = sum(daily_returns) / len(daily_returns)
+                variance = sum((r - mean_ret) ** 2 for r in daily_returns) / len(
+                    daily_returns
+                )
+                std = math.sqrt(variance)
+                if std > 0:
+                    sharpe_ratio = mean_ret / std * math.sqrt(252)
+
+            peak = values[0]
+            max_drawdown = 0.0
+            for value in values:
+                if value > peak:
+                    peak = value
+                drawdown = (peak - value) / peak if peak > 0 else 0.0
+                if drawdown > max_drawdown:
+                    max_drawdown = drawdown
+
+        sell_count = 0
+        win_count = 0
+        for side, pnl in zip(self._trade_sides, self._trade_pnls):
+            if side == "SELL":
+                sell_count += 1
+                if pnl > 0:
+                    win_count += 1
+        win_rate = (win_count / sell_count) if sell_count else 0.0
 
         return BacktestResult(
             initial_cash=self.initial_cash,
@@ -366,11 +490,35 @@ class SimpleBacktestEngine(Plugin):
             sharpe_ratio=sharpe_ratio,
             max_drawdown=max_drawdown,
             win_rate=win_rate,
-            trade_count=len(self._trades),
-            net_value_series=list(self._net_value_series),
-            trades=list(self._trades),
+            trade_count=len(self._trade_dates),
+            net_value_series=[
+                {"date": nv_date, "value": nv_value}
+                for nv_date, nv_value in zip(nv_dates, values)
+            ],
+            trades=self._trades_as_dicts(),
         )
 
+    @staticmethod
+    def _vector_stats(values: Sequence[float]) -> tuple[float, float]:
+        """Compute sharpe ratio and max drawdown with NumPy reductions."""
+        v = np.asarray(values, dtype=np.float64)
+
+        sharpe_ratio = 0.0
+        if v.size >= 2:
+            prev = v[:-1]
+            returns = v[1:][prev > 0] / prev[prev > 0] - 1.0
+            if returns.size:
+                std = float(returns.std())
+                if std > 0:
+                    sharpe_ratio = float(returns.mean()) / std * math.sqrt(252)
+
+        peak = np.maximum.accumulate(v)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns = np.where(peak > 0, (peak - v) / peak, 0.0)
+        max_drawdown = float(drawdowns.max()) if drawdowns.size else 0.0
+
+        return sharpe_ratio, max_drawdown
+
     @staticmethod
     def _coerce_date(value: Any) -> date:
         if isinstance(value, datetime):
@@ -378,6 +526,13 @@ class SimpleBacktestEngine(Plugin):
         if isinstance(value, date):
             return value
         if isinstance(value, str):
+            # Dominant case is ISO "YYYY-MM-DD"; slicing into int() avoids
+            # the strptime format machinery entirely.
+            if len(value) == 10 and value[4] == "-" and value[7] == "-":
+                try:
+                    return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+                except ValueError:
+                    pass
             for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d"):
                 try:
                     return datetime.strptime(value, fmt).date()
@@ -395,6 +550,12 @@ class SimpleBacktestEngine(Plugin):
         orders: list[dict[str, Any]] = []
         for signal in raw_signals:
             if isinstance(signal, dict):
+                # 快路径：已具备完整订单字段且 quantity 为真值的 dict
+                # 信号直接透传。falsy quantity 必须走慢路径的 ``or 1``
+                # 兜底：撮合阶段会把 None/0 自动放大成按资金计算的数量。
+                if signal.keys() >= _ORDER_FIELDS and signal["quantity"]:
+                    orders.append(signal)
+                    continue
                 symbol = str(signal.get("symbol", ""))
                 side = str(signal.get("side", signal.get("direction", ""))).upper()
                 quantity = int(signal.get("quantity", 1) or 1)
@@ -6,10 +6,13 @@ convertible bonds and A-share daily bars.
 
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
+from pathlib import Path
 from typing import Any, cast
 
-from core.cache import CacheManager, MemoryCache
+from core.cache import CacheBackend, CacheManager, FileCache, MemoryCache, TieredCache
 from core.context import Context
 from plugins.base import Plugin
 
@@ -18,6 +21,11 @@ try:
 except ImportError:  # pragma: no cover - tests patch module-level ak directly
     ak = None
 
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - pandas ships with akshare
+    pd = None
+
 
 class AKShareDataSource(Plugin):
     """AKShare 数据源插件，支持可转债和 A 股数据。"""
@@ -26,11 +34,27 @@ class AKShareDataSource(Plugin):
     version = "1.0.0"
     description = "AKShare data source for convertible bonds and A-shares"
 
-    def __init__(self) -> None:
-        """Initialize plugin and cache manager."""
+    # Per-endpoint TTLs; bumped to one day when a persistent disk tier is on.
+    _list_ttl: float = 60.0
+    _history_ttl: float = 60.0
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """Initialize plugin and cache manager.
+
+        Args:
+            cache_dir: Optional directory for a persistent disk cache tier.
+                When given, cached lists/history survive process restarts.
+        """
         super().__init__()
-        self._cache = CacheManager(MemoryCache())
+        backend: CacheBackend = MemoryCache()
+        if cache_dir is not None:
+            backend = TieredCache(backend, FileCache(Path(cache_dir) / "akshare"))
+            self._list_ttl = 86400.0
+            self._history_ttl = 86400.0
+        self._cache = CacheManager(backend)
         self._context: Context | None = None
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_stop: threading.Event | None = None
 
     def setup(self, context: Context) -> None:
         """Bind runtime context for this plugin instance."""
@@ -39,8 +63,61 @@ class AKShareDataSource(Plugin):
     def teardown(self, context: Context) -> None:
         """Release runtime context references."""
         _ = context
+        self.stop_background_refresh()
         self._context = None
 
+    def start_background_refresh(self, interval_s: float = 840.0) -> None:
+        """Keep the convertible bond list cache warm from a daemon thread.
+
+        The worker fetches ``bond_zh_cov`` immediately and then every
+        ``interval_s`` seconds, writing straight into the same cache the
+        synchronous :meth:`fetch_cb_list` path reads, so first access
+        returns from RAM instead of blocking on the network. Entries are
+        stored with one refresh interval of TTL headroom, bounding
+        staleness at roughly ``interval_s``. Idempotent while a worker
+        is alive; fetch errors keep the last cached value.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        stop = threading.Event()
+
+        def _worker() -> None:
+            while True:
+                try:
+                    self._refresh_cb_list(ttl=interval_s + self._list_ttl)
+                except RuntimeError:
+                    # Network hiccup: keep serving the last cached value.
+                    pass
+                if stop.wait(interval_s):
+                    return
+
+        thread = threading.Thread(
+            target=_worker, name="akshare-cb-list-refresh", daemon=True
+        )
+        self._refresh_stop = stop
+        self._refresh_thread = thread
+        thread.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresh worker, if one is running."""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5.0)
+        self._refresh_thread = None
+        self._refresh_stop = None
+
+    def _refresh_cb_list(self, ttl: float) -> None:
+        """Fetch the bond list and overwrite its cache entry."""
+        key = self._cache.cache_key("cb_list")
+        try:
+            frame = self._ak().bond_zh_cov()
+            rows = self._to_records(frame)
+        except Exception as exc:  # noqa: BLE001
+            raise RuntimeError("fetch_cb_list failed") from exc
+        self._cache.set(key, rows, ttl=ttl)
+
     def _ak(self) -> Any:
         """Return AKShare module or raise clear runtime error when unavailable."""
         if ak is None:
@@ -49,6 +126,11 @@ class AKShareDataSource(Plugin):
 
     def fetch_cb_list(self) -> list[dict[str, Any]]:
         """Fetch convertible bond list."""
+        key = self._cache.cache_key("cb_list")
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -57,9 +139,9 @@ class AKShareDataSource(Plugin):
             except Exception as exc:  # noqa: BLE001
                 raise RuntimeError("fetch_cb_list failed") from exc
 
-        key = self._cache.cache_key("cb_list")
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=60.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._list_ttl),
         )
 
     def fetch_cb_realtime(self, codes: list[str]) -> list[dict[str, Any]]:
@@ -83,25 +165,74 @@ class AKShareDataSource(Plugin):
         end: date,
     ) -> list[dict[str, Any]]:
         """Fetch normalized historical daily bars for one convertible bond."""
+        key = self._cache.cache_key("cb_history", code, start, end)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
                 frame = self._ak().bond_zh_hs_cov_daily(symbol=code)
+                normalized = self._normalize_frame(
+                    frame, symbol=code, start=start, end=end
+                )
+                if normalized is not None:
+                    return normalized
                 rows = self._to_records(frame)
-                normalized = [self._normalize_bar(row, symbol=code) for row in rows]
                 return [
                     bar
-                    for bar in normalized
+                    for bar in (self._normalize_bar(row, symbol=code) for row in rows)
                     if start <= cast(datetime, bar.get("datetime")).date() <= end
                 ]
             except Exception as exc:  # noqa: BLE001
                 raise RuntimeError("fetch_cb_history failed") from exc
 
-        key = self._cache.cache_key("cb_history", code, start, end)
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=60.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._history_ttl),
         )
 
+    def fetch_cb_history_bulk(
+        self,
+        codes: list[str],
+        start: date,
+        end: date,
+        max_workers: int = 16,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch normalized history for many convertible bonds concurrently.
+
+        The per-symbol HTTP round-trips are I/O-bound, so they fan out
+        across a thread pool; each symbol still goes through
+        :meth:`fetch_cb_history` and its cache. A failed symbol maps to
+        an empty list instead of aborting the whole batch.
+        """
+        results: dict[str, list[dict[str, Any]]] = {}
+        if not codes:
+            return results
+
+        workers = min(max_workers, len(codes))
+        if workers <= 1:
+            for code in codes:
+                try:
+                    results[code] = self.fetch_cb_history(code, start, end)
+                except RuntimeError:
+                    results[code] = []
+            return results
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.fetch_cb_history, code, start, end): code
+                for code in codes
+            }
+            for future in as_completed(futures):
+                code = futures[future]
+                try:
+                    results[code] = future.result()
+                except RuntimeError:
+                    results[code] = []
+        return results
+
     def fetch_stock_daily(
         self,
         symbol: str,
@@ -109,6 +240,11 @@ class AKShareDataSource(Plugin):
         end: date,
     ) -> list[dict[str, Any]]:
         """Fetch normalized A-share historical daily bars."""
+        key = self._cache.cache_key("stock_daily", symbol, start, end)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # 缓存命中时完全跳过 _factory 闭包的构造
+            return cast(list[dict[str, Any]], cached)
 
         def _factory() -> list[dict[str, Any]]:
             try:
@@ -118,15 +254,102 @@ class AKShareDataSource(Plugin):
                     end_date=end.strftime("%Y%m%d"),
                     adjust="",
                 )
+                normalized = self._normalize_frame(frame, symbol=symbol)
+                if normalized is not None:
+                    return normalized
                 rows = self._to_records(frame)
                 return [self._normalize_bar(row, symbol=symbol) for row in rows]
             except Exception as exc:  # noqa: BLE001
                 raise RuntimeError("fetch_stock_daily failed") from exc
 
-        key = self._cache.cache_key("stock_daily", symbol, start, end)
         return cast(
-            list[dict[str, Any]], self._cache.get_or_set(key, _factory, ttl=60.0)
+            list[dict[str, Any]],
+            self._cache.get_or_set(key, _factory, ttl=self._history_ttl),
+        )
+
+    @staticmethod
+    def _normalize_frame(
+        frame: Any,
+        symbol: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Normalize a whole DataFrame with columnar batch operations.
+
+        When ``start``/``end`` are given, the date-range filter runs as a
+        single vectorized boolean mask before any dicts are built.
+
+        Returns ``None`` when the input is not a real pandas DataFrame (or
+        misses expected columns) so callers can fall back to per-row
+        :meth:`_normalize_bar`.
+        """
+        if pd is None or not isinstance(frame, pd.DataFrame):
+            return None
+        if frame.empty:
+            return []
+
+        def _column(*names: str) -> Any:
+            for name in names:
+                if name in frame.columns:
+                    return frame[name]
+            return None
+
+        dt_col = _column("日期", "datetime", "date")
+        price_cols = [
+            _column("开盘", "open"),
+            _column("最高", "high"),
+            _column("最低", "low"),
+            _column("收盘", "close"),
+        ]
+        volume_col = _column("成交量", "volume")
+        amount_col = _column("成交额", "amount")
+        if dt_col is None or volume_col is None or any(
+            col is None for col in price_cols
+        ):
+            return None
+
+        dt_index = pd.to_datetime(dt_col.to_numpy(), cache=True)
+        opens, highs, lows, closes = (
+            col.astype("float64").to_numpy() for col in price_cols
         )
+        volumes = volume_col.astype("float64").to_numpy()
+        if amount_col is not None:
+            amounts = amount_col.fillna(0.0).astype("float64").to_numpy()
+        else:
+            amounts = None
+
+        if start is not None and end is not None:
+            days = dt_index.normalize()
+            keep = (days >= pd.Timestamp(start)) & (days <= pd.Timestamp(end))
+            if not keep.all():
+                dt_index = dt_index[keep]
+                opens = opens[keep]
+                highs = highs[keep]
+                lows = lows[keep]
+                closes = closes[keep]
+                volumes = volumes[keep]
+                if amounts is not None:
+                    amounts = amounts[keep]
+
+        datetimes = dt_index.to_pydatetime()
+        if amounts is None:
+            amounts = [0.0] * len(datetimes)
+
+        return [
+            {
+                "symbol": symbol,
+                "datetime": dt,
+                "open": float(o),
+                "high": float(h),
+                "low": float(lo),
+                "close": float(c),
+                "volume": int(v),
+                "amount": float(a),
+            }
+            for dt, o, h, lo, c, v, a in zip(
+                datetimes, opens, highs, lows, closes, volumes, amounts
+            )
+        ]
 
     def _normalize_bar(self, raw: dict[str, Any], symbol: str) -> dict[str, Any]:
         """Normalize raw bar payload to framework standard format."""
@@ -163,6 +386,13 @@ class AKShareDataSource(Plugin):
         if isinstance(value, date):
             return datetime.combine(value, datetime.min.time())
         if isinstance(value, str):
+            # Dominant AKShare case is ISO "YYYY-MM-DD"; slicing into int()
+            # avoids the strptime format machinery entirely.
+            if len(value) == 10 and value[4] == "-" and value[7] == "-":
+                try:
+                    return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]))
+                except ValueError:
+                    pass
             for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d", "%Y-%m-%d %H:%M:%S"):
                 try:
                     return datetime.strptime(value, fmt)
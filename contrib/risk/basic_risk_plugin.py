@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import logging
+import sys
 from typing import Any, TypedDict
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
 from core.context import Context
 from core.risk import RiskCheckResult
 from plugins.base import Plugin
@@ -50,13 +57,21 @@ class BasicRiskPlugin(Plugin):
         _ = context
 
     def check_order(self, order: dict[str, Any], context: Context) -> RiskCheckResult:
-        side = str(order.get("side", "BUY")).upper()
-        if side != "BUY":
+        side = order.get("side", "BUY")
+        if side != "BUY" and (
+            not isinstance(side, str) or side.upper() != "BUY"
+        ):
             return RiskCheckResult(passed=True)
 
-        symbol = str(order.get("symbol", ""))
-        quantity = int(order.get("quantity", 0) or 0)
-        price = float(order.get("price", 0.0) or 0.0)
+        symbol = order.get("symbol") or ""
+        if not isinstance(symbol, str):
+            symbol = str(symbol)
+        quantity = order.get("quantity") or 0
+        if not isinstance(quantity, int):
+            quantity = int(quantity)
+        price = order.get("price") or 0.0
+        if not isinstance(price, float):
+            price = float(price)
 
         if not symbol or quantity <= 0 or price <= 0:
             return RiskCheckResult(
@@ -64,27 +79,137 @@ class BasicRiskPlugin(Plugin):
                 violations=["Invalid order fields for risk check"],
             )
 
+        # Interning lets the portfolio's dict lookups hit the pointer-
+        # equality fast path even for symbols parsed fresh from JSON/CSV.
+        symbol = sys.intern(symbol)
+        portfolio = context.portfolio
         violations: list[str] = []
 
         trade_amount = quantity * price
-        max_trade_amount = context.portfolio.cash * self.max_trade_ratio
+        max_trade_amount = portfolio.cash * self.max_trade_ratio
         if trade_amount > max_trade_amount:
             violations.append(
                 f"Trade amount violation: {trade_amount:.2f} > limit {max_trade_amount:.2f}"
             )
 
-        total_assets = context.portfolio.get_total_value({symbol: price})
+        total_assets = portfolio.get_total_value({symbol: price})
         if total_assets > 0:
-            position = context.portfolio.get_position(symbol)
+            position = portfolio.get_position(symbol)
             current_qty = position.quantity if position is not None else 0
             projected_value = (current_qty + quantity) * price
             position_ratio = projected_value / total_assets
-            if position_ratio > self.max_position_ratio:
+            max_position_ratio = self.max_position_ratio
+            if position_ratio > max_position_ratio:
                 violations.append(
-                    f"Position ratio violation: {position_ratio:.2%} > limit {self.max_position_ratio:.2%}"
+                    f"Position ratio violation: {position_ratio:.2%} > limit {max_position_ratio:.2%}"
+                )
+
+        if not violations:
+            return RiskCheckResult(passed=True)
+        return RiskCheckResult(passed=False, violations=violations)
+
+    def check_orders(
+        self, orders: list[dict[str, Any]], context: Context
+    ) -> list[RiskCheckResult]:
+        """批量风控检查，等价于逐单调用 ``check_order``。
+
+        BUY 单的金额与仓位比例检查在 NumPy 中一次性完成，适合每根 K 线
+        批量提交候选订单的回测场景；NumPy 不可用或批量过小时退回逐单路径。
+        """
+        if np is None or len(orders) < 2:
+            return [self.check_order(order, context) for order in orders]
+
+        portfolio = context.portfolio
+        results: list[RiskCheckResult | None] = [None] * len(orders)
+        indices: list[int] = []
+        symbols: list[str] = []
+        quantities: list[int] = []
+        prices: list[float] = []
+
+        for index, order in enumerate(orders):
+            side = order.get("side", "BUY")
+            if side != "BUY" and (
+                not isinstance(side, str) or side.upper() != "BUY"
+            ):
+                results[index] = RiskCheckResult(passed=True)
+                continue
+
+            symbol = order.get("symbol") or ""
+            if not isinstance(symbol, str):
+                symbol = str(symbol)
+            quantity = order.get("quantity") or 0
+            if not isinstance(quantity, int):
+                quantity = int(quantity)
+            price = order.get("price") or 0.0
+            if not isinstance(price, float):
+                price = float(price)
+
+            if not symbol or quantity <= 0 or price <= 0:
+                results[index] = RiskCheckResult(
+                    passed=False,
+                    violations=["Invalid order fields for risk check"],
                 )
+                continue
+
+            indices.append(index)
+            symbols.append(sys.intern(symbol))
+            quantities.append(quantity)
+            prices.append(price)
+
+        if indices:
+            qty = np.asarray(quantities, dtype=np.float64)
+            px = np.asarray(prices, dtype=np.float64)
+            cash = portfolio.cash
+
+            trade_amount = qty * px
+            max_trade_amount = cash * self.max_trade_ratio
+            over_trade = trade_amount > max_trade_amount
+
+            # get_total_value({symbol: price}) values the ordered symbol at
+            # the order price and every other position at cost, which is
+            # cost_basis + held_qty * (price - cost) per order.
+            positions = portfolio.positions
+            cost_basis = cash
+            for position in positions.values():
+                cost_basis += position.quantity * position.cost
+
+            held_qty = np.empty(len(indices), dtype=np.float64)
+            held_cost = np.empty(len(indices), dtype=np.float64)
+            for row, symbol in enumerate(symbols):
+                position = positions.get(symbol)
+                if position is None:
+                    held_qty[row] = 0.0
+                    held_cost[row] = 0.0
+                else:
+                    held_qty[row] = position.quantity
+                    held_cost[row] = position.cost
+
+            total_assets = cost_basis + held_qty * (px - held_cost)
+            projected_value = (held_qty + qty) * px
+            safe_assets = np.where(total_assets > 0, total_assets, 1.0)
+            position_ratio = projected_value / safe_assets
+            over_ratio = (total_assets > 0) & (
+                position_ratio > self.max_position_ratio
+            )
 
-        return RiskCheckResult(passed=len(violations) == 0, violations=violations)
+            for row, index in enumerate(indices):
+                violations: list[str] = []
+                if over_trade[row]:
+                    violations.append(
+                        f"Trade amount violation: {trade_amount[row]:.2f} > limit {max_trade_amount:.2f}"
+                    )
+                if over_ratio[row]:
+                    violations.append(
+                        f"Position ratio violation: {position_ratio[row]:.2%} > limit {self.max_position_ratio:.2%}"
+                    )
+                if violations:
+                    results[index] = RiskCheckResult(
+                        passed=False, violations=violations
+                    )
+                else:
+                    results[index] = RiskCheckResult(passed=True)
+
+        return [result for result in results if result is not None]
 
     def on_order(
         self, context: Context, order: dict[str, Any]
@@ -93,7 +218,9 @@ class BasicRiskPlugin(Plugin):
         if result.passed:
             return order
 
-        context.logger.warning(
-            "Order blocked by basic_risk: %s", "; ".join(result.violations)
-        )
+        logger = context.logger
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Order blocked by basic_risk: %s", "; ".join(result.violations)
+            )
         return None
@@ -9,10 +9,62 @@ from typing import Any, Literal
 from core.context import Context
 from plugins.base import Plugin
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
 
-@dataclass(slots=True)
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _score_kernel(
+        price: Any,
+        premium: Any,
+        volume: Any,
+        dtm: Any,
+        min_volume: float,
+        exclude_dtm: float,
+    ) -> tuple[Any, Any]:
+        """Fused (double_low, keep mask) pass over SoA columns."""
+        count = price.shape[0]
+        double_low = np.empty(count, dtype=np.float64)
+        keep = np.empty(count, dtype=np.bool_)
+        for index in range(count):
+            double_low[index] = price[index] + premium[index] * 100.0
+            keep[index] = volume[index] >= min_volume and dtm[index] > exclude_dtm
+        return double_low, keep
+
+else:
+
+    def _score_kernel(
+        price: Any,
+        premium: Any,
+        volume: Any,
+        dtm: Any,
+        min_volume: float,
+        exclude_dtm: float,
+    ) -> tuple[Any, Any]:
+        """Vectorized NumPy fallback for the scoring kernel."""
+        double_low = price + premium * 100.0
+        keep = (volume >= min_volume) & (dtm > exclude_dtm)
+        return double_low, keep
+
+
+@dataclass(slots=True, frozen=True)
 class Signal:
-    """Trading signal generated by strategy."""
+    """Trading signal generated by strategy.
+
+    Slotted and immutable: a backtest can emit thousands of these per
+    run, and nothing mutates a signal after creation.
+    """
 
     symbol: str
     direction: Literal["BUY", "SELL"]
@@ -75,8 +127,7 @@ class DoubleLowStrategy(Plugin):
         if not isinstance(cb_data, list):
             return []
 
-        sorted_data = self.calculate_double_low(cb_data)
-        top_codes = self.select_top_n(sorted_data)
+        top_codes = self._select_top_symbols(cb_data)
         signals = self.generate_signals(context, top_codes)
 
         context.set("double_low_last_rebalance_date", bar_date)
@@ -85,7 +136,24 @@ class DoubleLowStrategy(Plugin):
     def calculate_double_low(
         self, cb_data: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """计算双低值并过滤、排序。"""
+        """计算双低值并过滤、排序。
+
+        有 NumPy 时按列构建 SoA 数组，打分与过滤走单次融合内核
+        （装有 numba 时为 JIT 版本），仅对保留行重建字典；
+        否则退回逐行 Python 循环。
+        """
+        columns = self._score_columns(cb_data)
+        if columns is not None:
+            double_low, keep = columns
+            kept = np.flatnonzero(keep)
+            order = kept[np.argsort(double_low[kept], kind="stable")]
+            results: list[dict[str, Any]] = []
+            for index in order:
+                item = dict(cb_data[index])
+                item["double_low"] = float(double_low[index])
+                results.append(item)
+            return results
+
         processed: list[dict[str, Any]] = []
         for row in cb_data:
             volume = int(float(row.get("volume", 0) or 0))
@@ -105,6 +173,73 @@ class DoubleLowStrategy(Plugin):
         processed.sort(key=lambda x: float(x["double_low"]))
         return processed
 
+    def _score_columns(self, cb_data: list[dict[str, Any]]) -> tuple[Any, Any] | None:
+        """构建 SoA 列并返回 ``(double_low, keep)`` 数组。
+
+        无 NumPy 或行数过少时返回 ``None``，调用方退回逐行路径。
+        """
+        if np is None or len(cb_data) < 2:
+            return None
+
+        count = len(cb_data)
+        price = np.fromiter(
+            (float(row.get("price", 0.0) or 0.0) for row in cb_data),
+            dtype=np.float64,
+            count=count,
+        )
+        premium = np.fromiter(
+            (float(row.get("premium_rate", 0.0) or 0.0) for row in cb_data),
+            dtype=np.float64,
+            count=count,
+        )
+        volume = np.fromiter(
+            (float(row.get("volume", 0) or 0) for row in cb_data),
+            dtype=np.float64,
+            count=count,
+        )
+        dtm = np.fromiter(
+            (float(row.get("days_to_maturity", 999999) or 999999) for row in cb_data),
+            dtype=np.float64,
+            count=count,
+        )
+
+        return _score_kernel(
+            price,
+            premium,
+            volume,
+            dtm,
+            float(self.min_volume),
+            float(self.exclude_days_to_maturity),
+        )
+
+    def _select_top_symbols(self, cb_data: list[dict[str, Any]]) -> list[str]:
+        """一步完成打分、过滤与 Top N 选取。
+
+        ``argpartition`` 以线性时间选出 Top N 窗口并只对窗口排序，
+        避免为落选行做全量排序和字典重建；公开的
+        :meth:`calculate_double_low` / :meth:`select_top_n` 契约不变。
+        """
+        columns = self._score_columns(cb_data)
+        if columns is None:
+            return self.select_top_n(self.calculate_double_low(cb_data))
+
+        double_low, keep = columns
+        kept = np.flatnonzero(keep)
+        top_n = self.top_n
+        if kept.size > top_n:
+            scores = double_low[kept]
+            window = np.argpartition(scores, top_n)[:top_n]
+            order = kept[window[np.argsort(scores[window], kind="stable")]]
+        else:
+            order = kept[np.argsort(double_low[kept], kind="stable")]
+
+        selected: list[str] = []
+        for index in order:
+            symbol = str(cb_data[index].get("symbol", ""))
+            if symbol:
+                selected.append(symbol)
+        return selected
+
     def select_top_n(self, sorted_data: list[dict[str, Any]]) -> list[str]:
         """选取双低值最小的 Top N 可转债代码。"""
         selected: list[str] = []
@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
+import mmap
+import os
 import pickle
 import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from pathlib import Path
-from threading import RLock
+from threading import Lock, RLock
 from typing import Any, Literal
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# Below this size a plain read is cheaper than setting up a mapping.
+_MMAP_READ_THRESHOLD = 64 * 1024
+
 
 class CacheBackend(ABC):
     """Abstract cache backend interface."""
@@ -45,23 +56,42 @@ class CacheBackend(ABC):
 
 
 class MemoryCache(CacheBackend):
-    """In-memory cache backed by a dictionary with TTL support."""
+    """In-memory cache backed by a dictionary with TTL support.
+
+    Reads are lock-free: a ``get`` is a single dict lookup plus an expiry
+    comparison, both atomic under the GIL, so the hot cache-hit path never
+    acquires the lock. The lock only guards writers.
+
+    Expired entries that are never read again are reclaimed by a batched
+    sweep over a min-heap of expiry deadlines, run every
+    ``_SWEEP_INTERVAL`` reads, so memory stays bounded without a per-set
+    timer or background thread.
+    """
+
+    _SWEEP_INTERVAL = 1024
 
     def __init__(self) -> None:
         self._data: dict[str, tuple[Any, float | None]] = {}
-        self._lock = RLock()
+        # No method re-enters another under this lock, so a plain Lock
+        # is enough and skips RLock's owner bookkeeping.
+        self._lock = Lock()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._reads_since_sweep = 0
 
     def get(self, key: str) -> Any | None:
-        with self._lock:
-            item = self._data.get(key)
-            if item is None:
-                return None
+        self._reads_since_sweep += 1
+        if self._reads_since_sweep >= self._SWEEP_INTERVAL:
+            self._sweep_expired()
 
-            value, expires_at = item
-            if self._is_expired(expires_at):
-                self._data.pop(key, None)
-                return None
-            return value
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._data.pop(key, None)
+            return None
+        return value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
         expires_at = self._expires_at(ttl)
@@ -70,6 +100,8 @@ class MemoryCache(CacheBackend):
                 self._data.pop(key, None)
                 return
             self._data[key] = (value, expires_at)
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
 
     def delete(self, key: str) -> None:
         with self._lock:
@@ -78,19 +110,32 @@ class MemoryCache(CacheBackend):
     def clear(self) -> None:
         with self._lock:
             self._data.clear()
+            self._expiry_heap.clear()
 
     def exists(self, key: str) -> bool:
         return self.get(key) is not None
 
+    def _sweep_expired(self) -> None:
+        self._reads_since_sweep = 0
+        now = time.monotonic()
+        with self._lock:
+            heap = self._expiry_heap
+            data = self._data
+            while heap and heap[0][0] <= now:
+                _, key = heapq.heappop(heap)
+                item = data.get(key)
+                # Only drop entries that are actually still expired; the
+                # key may have been rewritten with a later deadline.
+                if item is not None:
+                    expires_at = item[1]
+                    if expires_at is not None and expires_at <= now:
+                        data.pop(key, None)
+
     @staticmethod
     def _expires_at(ttl: float | None) -> float | None:
         if ttl is None:
             return None
-        return time.time() + ttl
-
-    @staticmethod
-    def _is_expired(expires_at: float | None) -> bool:
-        return expires_at is not None and time.time() >= expires_at
+        return time.monotonic() + ttl
 
 
 class FileCache(CacheBackend):
@@ -104,7 +149,7 @@ class FileCache(CacheBackend):
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._serializer = serializer
-        self._lock = RLock()
+        self._lock = Lock()
 
     def get(self, key: str) -> Any | None:
         path = self._path_for_key(key)
@@ -145,16 +190,23 @@ class FileCache(CacheBackend):
             path.unlink(missing_ok=True)
 
     def clear(self) -> None:
-        with self._lock:
-            for file in self._cache_dir.glob("cache_*"):
-                if file.is_file():
-                    file.unlink(missing_ok=True)
+        # scandir reuses the type info from readdir, avoiding the extra
+        # stat() and Path object that pathlib.glob pays per entry.
+        with self._lock, os.scandir(self._cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("cache_") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
 
     def exists(self, key: str) -> bool:
         return self.get(key) is not None
 
     def _path_for_key(self, key: str) -> Path:
-        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
         suffix = ".json" if self._serializer == "json" else ".pkl"
         return self._cache_dir / f"cache_{digest}{suffix}"
 
@@ -166,21 +218,43 @@ class FileCache(CacheBackend):
 
     def _write_record(self, path: Path, record: dict[str, Any]) -> None:
         if self._serializer == "json":
-            data = json.dumps(record, ensure_ascii=False).encode("utf-8")
-            path.write_bytes(data)
-            return
+            if orjson is not None:
+                # OPT_NON_STR_KEYS keeps stdlib-json parity: non-string
+                # dict keys are coerced to strings instead of raising.
+                data = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(record, ensure_ascii=False).encode("utf-8")
+        else:
+            data = pickle.dumps(record)
 
-        data = pickle.dumps(record)
-        path.write_bytes(data)
+        # Write to a temp file and rename so readers never observe a
+        # partially written record (os.replace is atomic on POSIX).
+        tmp = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
 
     def _read_record(self, path: Path) -> dict[str, Any] | None:
         try:
             if self._serializer == "json":
-                text = path.read_text(encoding="utf-8")
-                obj = json.loads(text)
+                raw = path.read_bytes()
+                obj = orjson.loads(raw) if orjson is not None else json.loads(raw)
             else:
-                obj = pickle.loads(path.read_bytes())  # noqa: S301
-        except (json.JSONDecodeError, OSError, pickle.PickleError, EOFError):
+                # mmap lets pickle read large records straight from the
+                # page cache without an intermediate bytes copy.
+                with path.open("rb") as handle:
+                    size = os.fstat(handle.fileno()).st_size
+                    if size >= _MMAP_READ_THRESHOLD:
+                        with mmap.mmap(
+                            handle.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mapped:
+                            obj = pickle.loads(mapped)  # noqa: S301
+                    else:
+                        obj = pickle.loads(handle.read())  # noqa: S301
+        except (ValueError, OSError, pickle.PickleError, EOFError):
             return None
 
         if not isinstance(obj, dict):
@@ -188,11 +262,74 @@ class FileCache(CacheBackend):
         return obj
 
 
+class TieredCache(CacheBackend):
+    """Two-level cache: a fast front backend with a persistent back backend.
+
+    Reads check the front first and promote back-tier hits into the front;
+    writes and deletes go to both tiers. Typical usage is a ``MemoryCache``
+    front with a ``FileCache`` back so cached data survives process restarts.
+    """
+
+    def __init__(
+        self,
+        front: CacheBackend,
+        back: CacheBackend,
+        promote_ttl: float | None = 60.0,
+    ) -> None:
+        """Initialize tiered cache.
+
+        Args:
+            front: Fast first-level backend.
+            back: Persistent second-level backend.
+            promote_ttl: TTL applied when promoting back-tier hits into the
+                front tier, bounding staleness since the original TTL of the
+                record is not recoverable from the backend interface.
+        """
+        self.front = front
+        self.back = back
+        self.promote_ttl = promote_ttl
+
+    def get(self, key: str) -> Any | None:
+        value = self.front.get(key)
+        if value is not None:
+            return value
+
+        value = self.back.get(key)
+        if value is not None:
+            self.front.set(key, value, self.promote_ttl)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.front.set(key, value, ttl)
+        self.back.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self.front.delete(key)
+        self.back.delete(key)
+
+    def clear(self) -> None:
+        self.front.clear()
+        self.back.clear()
+
+    def exists(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
 class CacheManager:
     """Facade for cache operations on top of a cache backend."""
 
     def __init__(self, backend: CacheBackend) -> None:
         self.backend = backend
+        self._key_locks: dict[str, RLock] = {}
+        self._key_locks_guard = RLock()
+
+    def get(self, key: str) -> Any | None:
+        """Return cached value for key, or ``None`` on miss."""
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store value for key, overwriting any cached entry."""
+        self.backend.set(key, value, ttl)
 
     def get_or_set(
         self,
@@ -200,18 +337,38 @@ class CacheManager:
         factory: Callable[[], Any],
         ttl: float | None = None,
     ) -> Any:
-        """Return cached value when hit, otherwise compute and cache it."""
+        """Return cached value when hit, otherwise compute and cache it.
+
+        Concurrent misses on the same key are serialized through a
+        per-key lock with a double-check after acquiring it, so an
+        expensive ``factory`` runs once instead of once per caller.
+        """
         cached = self.backend.get(key)
         if cached is not None:
             return cached
 
-        value = factory()
-        self.backend.set(key, value, ttl)
+        with self._key_locks_guard:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = RLock()
+
+        with lock:
+            cached = self.backend.get(key)
+            if cached is not None:
+                return cached
+
+            value = factory()
+            self.backend.set(key, value, ttl)
+
+        with self._key_locks_guard:
+            self._key_locks.pop(key, None)
         return value
 
     @staticmethod
     def cache_key(prefix: str, *args: Any) -> str:
         """Build deterministic cache key from prefix and arbitrary arguments."""
-        payload = "|".join(repr(arg) for arg in args)
-        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-        return f"{prefix}:{digest}"
+        hasher = hashlib.blake2b(digest_size=8)
+        for arg in args:
+            hasher.update(repr(arg).encode("utf-8"))
+            hasher.update(b"|")
+        return f"{prefix}:{hasher.hexdigest()}"
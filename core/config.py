@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from copy import deepcopy
 from datetime import date
 from pathlib import Path
 from typing import Any, Literal
@@ -84,10 +84,12 @@ class StrategyConfig(BaseModel):
         strategy_name = data.get("name", "double_low")
         raw_params = data.get("params", {})
 
+        # Copy instead of mutating: the input dict may share subtrees
+        # with the manager's cached defaults dump.
         if strategy_name == "double_low":
-            data["params"] = DoubleLowParams.model_validate(raw_params)
+            data = {**data, "params": DoubleLowParams.model_validate(raw_params)}
         elif strategy_name == "macd":
-            data["params"] = MACDParams.model_validate(raw_params)
+            data = {**data, "params": MACDParams.model_validate(raw_params)}
         return data
 
 
@@ -183,8 +185,15 @@ class FrameworkConfig(BaseModel):
 class ConfigManager:
     """Load and validate framework configuration from TOML files."""
 
+    _VALIDATED_CACHE_SIZE = 8
+
     def __init__(self, defaults: FrameworkConfig | None = None) -> None:
         self._defaults = defaults or FrameworkConfig()
+        # Defaults are immutable after construction, so dump them once
+        # instead of re-serializing the pydantic tree on every load.
+        self._defaults_dump = self._defaults.model_dump(mode="python")
+        # Memoized from_dict results, keyed on input digest + env generation.
+        self._validated_cache: dict[tuple[str, int], FrameworkConfig] = {}
 
     @property
     def defaults(self) -> FrameworkConfig:
@@ -200,29 +209,72 @@ class ConfigManager:
         return self.from_dict(data)
 
     def from_dict(self, data: dict[str, Any]) -> FrameworkConfig:
-        """Validate configuration from dict, merged onto defaults and env vars."""
-        merged = _deep_merge(
-            self._defaults.model_dump(mode="python"),
-            data,
-        )
+        """Validate configuration from dict, merged onto defaults and env vars.
+
+        Results are memoized on the input contents, so repeated loads of
+        identical data skip merge and pydantic validation entirely. The
+        returned model is shared between such calls and should be treated
+        as read-only.
+        """
+        digest = hashlib.blake2b(repr(data).encode("utf-8"), digest_size=8)
+        cache_key = (digest.hexdigest(), _ENV_CACHE_GENERATION)
+        cached = self._validated_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        merged = _deep_merge(self._defaults_dump, data)
         merged_with_env = _apply_env_overrides(merged)
-        return FrameworkConfig.model_validate(merged_with_env)
+        config = FrameworkConfig.model_validate(merged_with_env)
+
+        cache = self._validated_cache
+        if len(cache) >= self._VALIDATED_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[cache_key] = config
+        return config
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    merged = deepcopy(base)
-    for key, value in override.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+    """Merge override onto base without mutating either argument.
+
+    Only subtrees actually touched by ``override`` are copied; untouched
+    branches share references with ``base``, avoiding the full-tree
+    deepcopy the recursive version paid on every call.
+    """
+    merged = dict(base)
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(merged, override)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            existing = target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                copied = dict(existing)
+                target[key] = copied
+                stack.append((copied, value))
+            else:
+                target[key] = value
     return merged
 
 
-def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
-    """Apply env overrides using QUANT__A__B style keys."""
-    overridden = deepcopy(config)
+# Parsed QUANT__ overrides, scanned lazily from os.environ on first use.
+# The generation counter lets memoized results key on the current scan.
+_ENV_OVERRIDES_CACHE: list[tuple[list[str], Any]] | None = None
+_ENV_CACHE_GENERATION = 0
+
+
+def invalidate_env_cache() -> None:
+    """Drop the cached QUANT__ scan after changing os.environ."""
+    global _ENV_OVERRIDES_CACHE, _ENV_CACHE_GENERATION
+    _ENV_OVERRIDES_CACHE = None
+    _ENV_CACHE_GENERATION += 1
 
+
+def _env_overrides() -> list[tuple[list[str], Any]]:
+    global _ENV_OVERRIDES_CACHE
+    cached = _ENV_OVERRIDES_CACHE
+    if cached is not None:
+        return cached
+
+    cached = []
     for key, raw_value in os.environ.items():
         if not key.startswith("QUANT__"):
             continue
@@ -235,18 +287,28 @@ def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
         if not keys:
             continue
 
-        _set_nested(overridden, keys, _parse_env_value(raw_value))
+        cached.append((keys, _parse_env_value(raw_value)))
+
+    _ENV_OVERRIDES_CACHE = cached
+    return cached
 
+
+def _apply_env_overrides(config: dict[str, Any]) -> dict[str, Any]:
+    """Apply env overrides using QUANT__A__B style keys."""
+    overridden = dict(config)
+    for keys, value in _env_overrides():
+        _set_nested(overridden, keys, value)
     return overridden
 
 
 def _set_nested(root: dict[str, Any], keys: list[str], value: Any) -> None:
+    # Copy each dict along the path before descending, so writes never
+    # leak into subtrees shared with the merge input.
     current: dict[str, Any] = root
     for key in keys[:-1]:
         child = current.get(key)
-        if not isinstance(child, dict):
-            child = {}
-            current[key] = child
+        child = dict(child) if isinstance(child, dict) else {}
+        current[key] = child
         current = child
     current[keys[-1]] = value
 
@@ -42,8 +42,15 @@ class Context:
     event_engine: EventEngine
     logger: logging.Logger
     data: dict[str, Any] = field(default_factory=dict)
-    _tokens: list[contextvars.Token[Context | None]] = field(
-        default_factory=list,
+    # Single-entry fast path: most contexts are entered exactly once, so
+    # keep one token inline and only allocate a stack on re-entry.
+    _token: contextvars.Token[Context | None] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _token_stack: list[contextvars.Token[Context | None]] | None = field(
+        default=None,
         init=False,
         repr=False,
     )
@@ -69,16 +76,41 @@ class Context:
         """
         self.data[key] = value
 
+    def __getitem__(self, key: str) -> Any:
+        """Return ``self.data[key]``; hot paths may use ``ctx.data`` directly."""
+        return self.data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` in context data."""
+        self.data[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether ``key`` exists in context data."""
+        return key in self.data
+
     def __enter__(self) -> Context:
         """Set this context as current and return itself."""
         token = _current_context.set(self)
-        self._tokens.append(token)
+        if self._token is None:
+            self._token = token
+        else:
+            stack = self._token_stack
+            if stack is None:
+                stack = self._token_stack = []
+            stack.append(token)
         return self
 
     def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
         """Restore previous current context when leaving ``with`` block."""
         _ = (exc_type, exc, tb)
-        token = self._tokens.pop()
+        stack = self._token_stack
+        if stack:
+            token = stack.pop()
+        else:
+            token = self._token
+            if token is None:
+                raise RuntimeError("Context exited more times than entered")
+            self._token = None
         _current_context.reset(token)
 
 
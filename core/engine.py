@@ -10,18 +10,33 @@ QuantCore - EventEngine 事件引擎
 
 from __future__ import annotations
 
+import bisect
 import logging
-import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
+from time import time as _time_time
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar, Union
+from enum import IntEnum, auto
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class EventType(Enum):
-    """事件类型"""
+class EventType(IntEnum):
+    """事件类型
+
+    IntEnum + auto() 的连续取值让分发缓存可以用扁平列表按
+    ``.value`` 直接下标，替代字典哈希查找。
+    """
     # 行情事件
     BAR = auto()           # K线数据
     TICK = auto()          #  tick数据
@@ -47,33 +62,38 @@ class EventType(Enum):
     STRATEGY_STOP = auto() # 策略停止
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """事件对象"""
     type: EventType
     data: Any = None
-    timestamp: Optional[float] = None
+    # default_factory 直接调用模块级预绑定的 time()，高频建事件时
+    # 省去 __post_init__ 帧和每次的 import/属性查找
+    timestamp: float = field(default_factory=_time_time)
     source: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            import time
-            self.timestamp = time.time()
 
 
 # 处理器类型
 Handler = Callable[[Event], Optional[Event]]
 Middleware = Callable[[Event], Optional[Event]]
 
+# 全事件掩码：所有位均置 1，表示中间件不做类型过滤
+_ALL_EVENTS_MASK = -1
+
+# 高频事件类型：为其预编译专用分发闭包（见 _rebuild_specialized）
+_HOT_TYPES = (EventType.BAR, EventType.TICK)
 
-@dataclass
-class HandlerInfo:
-    """处理器信息"""
-    handler: Handler
-    priority: int = 0  # 数值越大优先级越高
-    
-    def __lt__(self, other: HandlerInfo) -> bool:
-        return self.priority < other.priority
+
+def event_mask(*event_types: EventType) -> int:
+    """把若干事件类型合成 ``use_filtered`` 所需的位掩码
+
+    Example:
+        engine.use_filtered(mw, event_mask(EventType.ORDER, EventType.TRADE))
+    """
+    mask = 0
+    for event_type in event_types:
+        mask |= 1 << event_type.value
+    return mask
 
 
 class EventEngine:
@@ -100,12 +120,34 @@ class EventEngine:
     
     def __init__(self):
         """初始化事件引擎"""
-        self._handlers: Dict[EventType, List[HandlerInfo]] = defaultdict(list)
-        self._middlewares: List[Middleware] = []
+        # 平行数组存储（SoA）：取负的优先级列表保持升序，供 bisect
+        # 做 O(log n) 定位；callable 列表按相同顺序维护
+        self._handler_neg_priorities: Dict[EventType, List[int]] = defaultdict(list)
+        self._handler_callables: Dict[EventType, List[Handler]] = defaultdict(list)
+        # 每种事件类型一份按优先级排好序的纯 callable 元组，只在
+        # register/unregister 时重建；扁平列表按 EventType.value 下标，
+        # 比字典查找少一次哈希（auto() 从 1 起，槽位 0 空置）
+        self._dispatch_cache: List[tuple[Handler, ...]] = (
+            [()] * (len(EventType) + 1)
+        )
+        # (中间件, 事件位掩码) 对；掩码在编译管道时生效，
+        # 让"只关心某几类事件"的中间件在其他事件上零开销跳过
+        self._middlewares: List[tuple[Middleware, int]] = []
+        # use() 时一次性把中间件链编译成嵌套闭包，put 只调用一次，
+        # 不再每个事件走一遍 Python for 循环 + try/except 搭建
+        self._compiled_pipeline: Optional[Middleware] = None
+        # 事件队列 + 重入标志：处理器产生的后续事件进队列，由同一个
+        # 排空循环处理，避免 put 递归带来的调用栈开销
+        self._queue: deque[Event] = deque()
+        self._dispatching = False
         self._running = False
         self._event_count = 0
         self._error_count = 0
-        
+        # 高频类型（BAR/TICK）的专用分发闭包，把管道和处理器元组
+        # 绑定进闭包默认参数，省掉每个事件的缓存查找
+        self._specialized: Dict[EventType, Callable[[Event], None]] = {}
+        self._rebuild_specialized()
+
         logger.info("EventEngine initialized")
     
     def on(self, event_type: EventType, priority: int = 0) -> Callable:
@@ -146,12 +188,16 @@ class EventEngine:
         if not callable(handler):
             raise ValueError(f"Handler must be callable, got {type(handler)}")
         
-        handler_info = HandlerInfo(handler=handler, priority=priority)
-        self._handlers[event_type].append(handler_info)
-        # 按优先级排序
-        self._handlers[event_type].sort(reverse=True)
-        
-        logger.debug(f"Registered handler for {event_type.name} with priority {priority}")
+        neg_priorities = self._handler_neg_priorities[event_type]
+        # bisect_right：同优先级保持注册顺序（与原稳定排序一致）
+        index = bisect.bisect_right(neg_priorities, -priority)
+        neg_priorities.insert(index, -priority)
+        self._handler_callables[event_type].insert(index, handler)
+        self._rebuild_dispatch_cache(event_type)
+
+        logger.debug(
+            "Registered handler for %s with priority %d", event_type.name, priority
+        )
     
     def unregister(self, event_type: EventType, handler: Handler) -> bool:
         """
@@ -164,13 +210,77 @@ class EventEngine:
         Returns:
             是否成功注销
         """
-        handlers = self._handlers.get(event_type, [])
-        for i, info in enumerate(handlers):
-            if info.handler == handler:
-                handlers.pop(i)
-                logger.debug(f"Unregistered handler for {event_type.name}")
+        callables = self._handler_callables.get(event_type, [])
+        for i, registered in enumerate(callables):
+            if registered == handler:
+                callables.pop(i)
+                self._handler_neg_priorities[event_type].pop(i)
+                self._rebuild_dispatch_cache(event_type)
+                logger.debug("Unregistered handler for %s", event_type.name)
                 return True
         return False
+
+    def _rebuild_dispatch_cache(self, event_type: EventType) -> None:
+        """重建某事件类型的分发缓存（已按优先级排序的 callable 元组）"""
+        self._dispatch_cache[event_type.value] = tuple(
+            self._handler_callables[event_type]
+        )
+        if event_type in _HOT_TYPES:
+            self._rebuild_specialized()
+
+    def _rebuild_specialized(self) -> None:
+        """为高频事件类型重建专用分发闭包
+
+        闭包把中间件管道和处理器元组绑进默认参数，分发时不再查
+        缓存列表；register/unregister/use 时整体重建。中间件若把
+        事件改写成其他类型，回退到通用缓存查找。
+        """
+        specialized: Dict[EventType, Callable[[Event], None]] = {}
+        pipeline = self._compiled_pipeline
+        queue = self._queue
+        dispatch_cache = self._dispatch_cache
+
+        for event_type in _HOT_TYPES:
+            def dispatch(
+                event: Event,
+                _handlers: tuple[Handler, ...] = dispatch_cache[event_type.value],
+                _pipeline: Optional[Middleware] = pipeline,
+                _type: EventType = event_type,
+            ) -> None:
+                self._event_count += 1
+                if _pipeline is None:
+                    current_event = event
+                    handlers = _handlers
+                else:
+                    current_event = _pipeline(event)
+                    if current_event is None:
+                        logger.debug("Event %s filtered by middleware", _type.name)
+                        return
+                    if current_event.type is _type:
+                        handlers = _handlers
+                    else:
+                        handlers = dispatch_cache[current_event.type.value]
+                for handler in handlers:
+                    try:
+                        result = handler(current_event)
+                        if (
+                            result is not None
+                            and result is not current_event
+                            and isinstance(result, Event)
+                        ):
+                            queue.append(result)
+                    except Exception as e:
+                        self._error_count += 1
+                        logger.error(
+                            "Handler error for %s: %s",
+                            current_event.type.name,
+                            e,
+                            exc_info=True,
+                        )
+
+            specialized[event_type] = dispatch
+
+        self._specialized = specialized
     
     def use(self, middleware: Middleware) -> None:
         """
@@ -191,79 +301,231 @@ class EventEngine:
         """
         if not callable(middleware):
             raise ValueError(f"Middleware must be callable, got {type(middleware)}")
-        
-        self._middlewares.append(middleware)
-        logger.debug(f"Added middleware, total: {len(self._middlewares)}")
+
+        self._middlewares.append((middleware, _ALL_EVENTS_MASK))
+        self._compiled_pipeline = self._compile_pipeline()
+        self._rebuild_specialized()
+        logger.debug("Added middleware, total: %d", len(self._middlewares))
+
+    def use_filtered(self, middleware: Middleware, event_mask: int) -> None:
+        """添加只对掩码内事件类型生效的中间件
+
+        高频场景下（如只记录 ORDER/TRADE 的日志中间件），
+        ``mask & (1 << type.value)`` 的位运算门比每个事件做一次
+        集合成员检查便宜得多；掩码用模块级 :func:`event_mask` 构造。
+
+        Args:
+            middleware: 中间件函数
+            event_mask: 事件类型位掩码，掩码外的事件原样透传
+        """
+        if not callable(middleware):
+            raise ValueError(f"Middleware must be callable, got {type(middleware)}")
+
+        self._middlewares.append((middleware, event_mask))
+        self._compiled_pipeline = self._compile_pipeline()
+        self._rebuild_specialized()
+        logger.debug("Added filtered middleware, total: %d", len(self._middlewares))
+
+    def _compile_pipeline(self) -> Optional[Middleware]:
+        """把中间件列表编译成单个可调用的链式闭包
+
+        每个中间件都预先包上错误隔离：异常记入错误计数并让原事件
+        继续传播，与逐个循环时的行为一致；返回 None 表示事件被过滤。
+        """
+        if not self._middlewares:
+            return None
+
+        def guarded(mw: Middleware) -> Middleware:
+            def run(event: Event) -> Optional[Event]:
+                try:
+                    return mw(event)
+                except Exception as e:
+                    logger.error("Middleware error: %s", e)
+                    self._error_count += 1
+                    return event
+            return run
+
+        pipeline: Optional[Middleware] = None
+        for mw, mask in reversed(self._middlewares):
+            safe_mw = guarded(mw)
+            if mask != _ALL_EVENTS_MASK:
+                # 掩码门：单次移位 + 按位与，掩码外的事件直接透传
+                def gated(
+                    event: Event,
+                    _mw: Middleware = safe_mw,
+                    _mask: int = mask,
+                    _next: Optional[Middleware] = pipeline,
+                ) -> Optional[Event]:
+                    if not _mask & (1 << event.type.value):
+                        return event if _next is None else _next(event)
+                    result = _mw(event)
+                    if result is None:
+                        return None
+                    return result if _next is None else _next(result)
+
+                pipeline = gated
+            elif pipeline is None:
+                pipeline = safe_mw
+            else:
+                def chained(
+                    event: Event,
+                    _mw: Middleware = safe_mw,
+                    _next: Middleware = pipeline,
+                ) -> Optional[Event]:
+                    result = _mw(event)
+                    if result is None:
+                        return None
+                    return _next(result)
+
+                pipeline = chained
+        return pipeline
     
     def put(self, event: Event) -> None:
         """
         发送事件
-        
+
         Args:
             event: 事件对象
         """
         if not self._running:
-            logger.warning(f"EventEngine not running, event {event.type.name} dropped")
+            logger.warning(
+                "EventEngine not running, event %s dropped", event.type.name
+            )
             return
-        
+
+        self._queue.append(event)
+        if not self._dispatching:
+            self._drain()
+
+    def put_many(self, events: Iterable[Event]) -> None:
+        """批量发送事件，整批入队后由一次排空循环处理"""
+        if not self._running:
+            logger.warning("EventEngine not running, events dropped")
+            return
+
+        self._queue.extend(events)
+        if not self._dispatching:
+            self._drain()
+
+    def _drain(self) -> None:
+        """排空事件队列；处理器返回的后续事件在同一循环内处理"""
+        self._dispatching = True
+        queue = self._queue
+        try:
+            while queue:
+                event = queue.popleft()
+                # 每轮重读 _specialized：处理器可能在分发中注册新
+                # 处理器触发重建
+                special = self._specialized.get(event.type)
+                if special is not None:
+                    special(event)
+                else:
+                    self._dispatch_one(event)
+        finally:
+            self._dispatching = False
+
+    def _dispatch_one(self, event: Event) -> None:
         self._event_count += 1
-        
-        # 中间件处理
-        current_event = event
-        for middleware in self._middlewares:
-            try:
-                current_event = middleware(current_event)
-                if current_event is None:
-                    # 中间件返回None，停止传播
-                    logger.debug(f"Event {event.type.name} filtered by middleware")
-                    return
-            except Exception as e:
-                logger.error(f"Middleware error: {e}")
-                self._error_count += 1
-                continue
-        
+
+        # 无中间件时走快路径：不做任何管道调用，直接分发。
+        # _compiled_pipeline 为 None 即等价于"零中间件"标志位
+        pipeline = self._compiled_pipeline
+        if pipeline is None:
+            current_event = event
+        else:
+            # 中间件处理（预编译链，一次调用）
+            current_event = pipeline(event)
+            if current_event is None:
+                # 中间件返回None，停止传播
+                logger.debug("Event %s filtered by middleware", event.type.name)
+                return
+
         # 分发给处理器
-        handlers = self._handlers.get(current_event.type, [])
-        for info in handlers:
+        handlers = self._dispatch_cache[current_event.type.value]
+        queue = self._queue
+        for handler in handlers:
             try:
-                result = info.handler(current_event)
-                # 处理器可以返回新事件，继续传播
-                if result is not None and result is not current_event:
-                    self.put(result)
+                result = handler(current_event)
+                # 处理器可以返回新事件，继续传播；非 Event 返回值
+                # （如测试替身的 Mock）不应被注入队列
+                if (
+                    result is not None
+                    and result is not current_event
+                    and isinstance(result, Event)
+                ):
+                    queue.append(result)
             except Exception as e:
                 # 错误隔离：单个处理器异常不影响其他处理器
+                # exc_info=True 把 traceback 格式化推迟到日志真正输出时
                 self._error_count += 1
                 logger.error(
-                    f"Handler error for {current_event.type.name}: {e}\n"
-                    f"{traceback.format_exc()}"
+                    "Handler error for %s: %s",
+                    current_event.type.name,
+                    e,
+                    exc_info=True,
                 )
                 continue
     
+    def _dispatch_system(self, event_type: EventType) -> None:
+        """直接分发系统生命周期事件（START/STOP）
+
+        不经过队列、中间件和事件计数：生命周期通知不是业务事件，
+        不应计入统计，也不应被业务中间件过滤或触发其错误计数。
+        """
+        event = Event(event_type, source="EventEngine")
+        for handler in self._dispatch_cache[event_type.value]:
+            try:
+                handler(event)
+            except Exception as e:
+                self._error_count += 1
+                logger.error(
+                    "Handler error for %s: %s", event_type.name, e, exc_info=True
+                )
+
     def start(self) -> None:
         """启动事件引擎"""
         self._running = True
         self._event_count = 0
         self._error_count = 0
-        
+
         # 发送启动事件
-        self.put(Event(EventType.START, source="EventEngine"))
+        self._dispatch_system(EventType.START)
         logger.info("EventEngine started")
-    
+
     def stop(self) -> None:
         """停止事件引擎"""
         # 发送停止事件
-        self.put(Event(EventType.STOP, source="EventEngine"))
-        
+        self._dispatch_system(EventType.STOP)
+
         self._running = False
         logger.info(
-            f"EventEngine stopped. "
-            f"Total events: {self._event_count}, "
-            f"Errors: {self._error_count}"
+            "EventEngine stopped. Total events: %d, Errors: %d",
+            self._event_count,
+            self._error_count,
         )
     
     def is_running(self) -> bool:
         """是否运行中"""
         return self._running
+
+    def reset(self) -> None:
+        """重置引擎状态（不改变运行标志）
+
+        清空处理器、中间件、统计与待处理队列，并重建分发缓存。
+        主要供测试复用同一引擎实例时在用例间隔离状态，
+        免去反复启停的开销。
+        """
+        self._handler_neg_priorities.clear()
+        self._handler_callables.clear()
+        # 原地清空：专用分发闭包按引用捕获该列表
+        self._dispatch_cache[:] = [()] * (len(EventType) + 1)
+        self._middlewares.clear()
+        self._compiled_pipeline = None
+        self._queue.clear()
+        self._dispatching = False
+        self._event_count = 0
+        self._error_count = 0
+        self._rebuild_specialized()
     
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
@@ -272,8 +534,8 @@ class EventEngine:
             "event_count": self._event_count,
             "error_count": self._error_count,
             "handlers": {
-                event_type.name: len(handlers)
-                for event_type, handlers in self._handlers.items()
+                event_type.name: len(callables)
+                for event_type, callables in self._handler_callables.items()
             },
             "middlewares": len(self._middlewares),
         }
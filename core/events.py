@@ -25,6 +25,13 @@ class EventType(str, Enum):
     HEARTBEAT = "HEARTBEAT"
 
 
+def _utc_now(
+    _now: Any = datetime.now, _utc: timezone = timezone.utc
+) -> datetime:
+    # Prebound arguments skip the global lookups on every Event creation.
+    return _now(_utc)
+
+
 @dataclass(slots=True)
 class Event:
     """Base event object passed through the event engine."""
@@ -32,7 +39,7 @@ class Event:
     event_type: EventType
     payload: dict[str, Any] = field(default_factory=dict)
     source: str | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
 
 
 # Convenient aliases for readability.
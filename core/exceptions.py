@@ -24,6 +24,10 @@ class QuantError(Exception):
         cause: Original exception that triggered this error.
     """
 
+    # Exceptions keep their args tuple; slots just drop the per-instance
+    # __dict__ for the four known attributes.
+    __slots__ = ("message", "code", "context", "cause")
+
     def __init__(
         self,
         message: str,
@@ -33,7 +37,12 @@ class QuantError(Exception):
     ) -> None:
         self.message: str = message
         self.code: str = code
-        self.context: dict[str, Any] = dict(context) if context is not None else {}
+        # Plain dicts are adopted as-is; only non-dict mappings (or None)
+        # pay for a copy. Callers hand over ownership of the context.
+        if type(context) is dict:
+            self.context: dict[str, Any] = context
+        else:
+            self.context = dict(context) if context is not None else {}
         self.cause: Exception | None = cause
 
         super().__init__(message)
@@ -43,12 +52,18 @@ class QuantError(Exception):
 
     def __str__(self) -> str:
         """Return a formatted, readable exception string."""
+        # Fast path for the common bare error: skip the context/cause
+        # formatting machinery entirely.
+        if not self.context and self.cause is None:
+            return f"[{self.code}] {self.message}"
         return format_exception(self)
 
 
 class ConfigError(QuantError):
     """Configuration related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -62,6 +77,8 @@ class ConfigError(QuantError):
 class DataError(QuantError):
     """Market data fetching/parsing related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -75,6 +92,8 @@ class DataError(QuantError):
 class StrategyError(QuantError):
     """Strategy execution related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -88,6 +107,8 @@ class StrategyError(QuantError):
 class RiskError(QuantError):
     """Risk-control related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -101,6 +122,8 @@ class RiskError(QuantError):
 class TradeError(QuantError):
     """Trade execution related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -114,6 +137,8 @@ class TradeError(QuantError):
 class ValidationError(QuantError):
     """Input/data validation related error."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -144,10 +169,9 @@ def wrap_exception(
     Returns:
         An instance of ``error_class`` that chains ``exc`` as its cause.
     """
-    kwargs: dict[str, Any] = {"context": context, "cause": exc}
     if code is not None:
-        kwargs["code"] = code
-    return error_class(message, **kwargs)
+        return error_class(message, code=code, context=context, cause=exc)
+    return error_class(message, context=context, cause=exc)
 
 
 def format_exception(exc: BaseException) -> str:
@@ -161,7 +185,7 @@ def format_exception(exc: BaseException) -> str:
         context_part = ""
         if exc.context:
             context_items = ", ".join(
-                f"{key}={value!r}" for key, value in sorted(exc.context.items())
+                f"{key}={value!r}" for key, value in exc.context.items()
             )
             context_part = f" | context: {context_items}"
 
@@ -8,8 +8,8 @@ from __future__ import annotations
 
 import json
 import logging
+import time
 from collections.abc import Mapping
-from datetime import datetime, timezone
 from typing import Any, TypedDict
 
 
@@ -30,7 +30,7 @@ class LoggingSetupConfig(TypedDict, total=False):
 
 
 _DEFAULT_FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
-_RESERVED_RECORD_FIELDS = {
+_RESERVED_RECORD_FIELDS = frozenset({
     "name",
     "msg",
     "args",
@@ -54,12 +54,17 @@ _RESERVED_RECORD_FIELDS = {
     "message",
     "asctime",
     "taskName",
-}
+})
 
 
 class JsonFormatter(logging.Formatter):
     """Format log records as one-line JSON objects."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Bind the encoder once; json.dumps re-parses its kwargs per call.
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+
     def format(self, record: logging.LogRecord) -> str:
         """Serialize a log record into JSON.
 
@@ -69,24 +74,27 @@ class JsonFormatter(logging.Formatter):
         Returns:
             A JSON string containing core log fields and extra context fields.
         """
+        # strftime on a struct_time is ~10x cheaper than constructing a
+        # datetime; millisecond precision is enough for log lines.
+        created = time.strftime(
+            "%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)
+        )
         payload: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            "timestamp": f"{created}.{int(record.msecs):03d}+00:00",
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
         }
-
-        for key, value in record.__dict__.items():
-            if key in _RESERVED_RECORD_FIELDS or key.startswith("_"):
-                continue
-            payload[key] = value
+        payload.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED_RECORD_FIELDS and not key.startswith("_")
+        )
 
         if record.exc_info is not None:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, ensure_ascii=False)
+        return self._encode(payload)
 
 
 def get_logger(name: str) -> logging.Logger:
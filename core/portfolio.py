@@ -2,14 +2,53 @@
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import Literal
+from typing import Any, Literal, Mapping
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_NUMBA = False
 
 TradeMode = Literal["T+0", "T+1"]
 
 
-@dataclass
+def _validate_trade_input(symbol: str, quantity: int, price: float) -> None:
+    """Validate common trade arguments.
+
+    Module-level with one combined check: the hot path pays a single
+    branch, and the per-field diagnosis only runs on the error path.
+    """
+    if not (symbol and quantity > 0 and price > 0):
+        if not symbol:
+            raise ValueError("symbol must not be empty")
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        raise ValueError("price must be positive")
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _valuate(quantity: Any, cost: Any, marks: Any) -> tuple[float, float]:
+        """Jitted (market_value, unrealized_pnl) reduction over positions."""
+        market_value = 0.0
+        unrealized = 0.0
+        for index in range(quantity.shape[0]):
+            market_value += quantity[index] * marks[index]
+            unrealized += (marks[index] - cost[index]) * quantity[index]
+        return market_value, unrealized
+
+
+@dataclass(slots=True)
 class Position:
     """A single security position.
 
@@ -47,7 +86,15 @@ class Portfolio:
         self.cash: float = float(initial_cash)
         self.positions: dict[str, Position] = {}
         self.trade_mode: TradeMode = trade_mode
-        self._pending_t1: dict[date, dict[str, int]] = {}
+        self._pending_t1: defaultdict[date, Counter[str]] = defaultdict(Counter)
+        self._tpv_cache: float = 0.0
+        self._tpv_key: tuple[float, tuple[tuple[str, float], ...]] | None = None
+        # Lazily rebuilt SoA snapshot of positions for NumPy valuations;
+        # the positions dict stays the source of truth.
+        self._soa_dirty: bool = True
+        self._soa_symbols: list[str] = []
+        self._soa_quantity: Any = None
+        self._soa_cost: Any = None
 
     def buy(self, symbol: str, quantity: int, price: float, date: date) -> None:
         """Execute a buy trade and update position/cash.
@@ -58,18 +105,21 @@ class Portfolio:
             price: Trade price.
             date: Trade date.
         """
-        self._validate_trade_input(symbol=symbol, quantity=quantity, price=price)
+        _validate_trade_input(symbol, quantity, price)
 
         amount = quantity * price
         if amount > self.cash:
             raise ValueError("Insufficient cash")
 
         self.cash -= amount
+        self._tpv_key = None
+        self._soa_dirty = True
 
-        existing = self.positions.get(symbol)
+        positions = self.positions
+        existing = positions.get(symbol)
         if existing is None:
             available = quantity if self.trade_mode == "T+0" else 0
-            self.positions[symbol] = Position(
+            positions[symbol] = Position(
                 symbol=symbol,
                 quantity=quantity,
                 cost=price,
@@ -86,8 +136,7 @@ class Portfolio:
                 existing.available += quantity
 
         if self.trade_mode == "T+1":
-            date_bucket = self._pending_t1.setdefault(date, {})
-            date_bucket[symbol] = date_bucket.get(symbol, 0) + quantity
+            self._pending_t1[date][symbol] += quantity
 
     def sell(self, symbol: str, quantity: int, price: float, date: date) -> float:
         """Execute a sell trade.
@@ -102,24 +151,34 @@ class Portfolio:
             Realized PnL for this trade.
         """
         _ = date
-        self._validate_trade_input(symbol=symbol, quantity=quantity, price=price)
-
-        position = self.positions.get(symbol)
-        if position is None or position.quantity < quantity:
+        _validate_trade_input(symbol, quantity, price)
+
+        positions = self.positions
+        try:
+            position = positions[symbol]
+        except KeyError:
+            raise ValueError("Insufficient position quantity") from None
+        if position.quantity < quantity:
             raise ValueError("Insufficient position quantity")
 
-        available = self.get_available_quantity(symbol, date)
+        # Inlined get_available_quantity: skips a method call and a second
+        # positions lookup; the public method itself stays unchanged.
+        available = (
+            position.quantity if self.trade_mode == "T+0" else position.available
+        )
         if quantity > available:
             raise ValueError("Insufficient available quantity")
 
         realized_pnl = (price - position.cost) * quantity
         self.cash += quantity * price
+        self._tpv_key = None
+        self._soa_dirty = True
 
         position.quantity -= quantity
         position.available -= quantity
 
         if position.quantity == 0:
-            del self.positions[symbol]
+            del positions[symbol]
         elif self.trade_mode == "T+0":
             position.available = position.quantity
 
@@ -146,22 +205,86 @@ class Portfolio:
 
         return position.available
 
-    def get_total_value(self, prices: dict[str, float]) -> float:
-        """Calculate total asset value using given market prices."""
-        market_value = 0.0
-        for symbol, position in self.positions.items():
-            market_price = prices.get(symbol, position.cost)
-            market_value += position.quantity * market_price
-        return self.cash + market_value
+    def get_total_value(self, prices: Mapping[str, float]) -> float:
+        """Calculate total asset value using given market prices.
+
+        The result is cached keyed on cash and the given price map, so
+        repeated valuations between trades (e.g. per-order risk checks)
+        skip the position walk. Trades invalidate the cache; including
+        cash in the key also covers direct cash adjustments such as
+        commission deductions.
+        """
+        key = (self.cash, tuple(prices.items()))
+        if key == self._tpv_key:
+            return self._tpv_cache
+
+        if np is not None:
+            quantity, cost, marks = self._gather_marks(prices)
+            if not len(marks):
+                market_value = 0.0
+            elif _HAS_NUMBA:
+                market_value, _ = _valuate(quantity, cost, marks)
+            else:
+                # BLAS dot avoids materializing the elementwise product.
+                market_value = float(np.dot(quantity, marks))
+        else:
+            market_value = 0.0
+            for symbol, position in self.positions.items():
+                market_price = prices.get(symbol, position.cost)
+                market_value += position.quantity * market_price
+
+        total = self.cash + market_value
+        self._tpv_key = key
+        self._tpv_cache = total
+        return total
 
-    def get_unrealized_pnl(self, prices: dict[str, float]) -> float:
+    def get_unrealized_pnl(self, prices: Mapping[str, float]) -> float:
         """Calculate unrealized PnL from current holdings."""
+        if np is not None:
+            quantity, cost, marks = self._gather_marks(prices)
+            if not len(marks):
+                return 0.0
+            if _HAS_NUMBA:
+                return _valuate(quantity, cost, marks)[1]
+            return float(((marks - cost) * quantity).sum())
+
         pnl = 0.0
         for symbol, position in self.positions.items():
             market_price = prices.get(symbol, position.cost)
             pnl += (market_price - position.cost) * position.quantity
         return pnl
 
+    def _refresh_soa(self) -> None:
+        positions = self.positions
+        self._soa_symbols = list(positions)
+        count = len(positions)
+        quantity = np.empty(count, dtype=np.float64)
+        cost = np.empty(count, dtype=np.float64)
+        for index, position in enumerate(positions.values()):
+            quantity[index] = position.quantity
+            cost[index] = position.cost
+        self._soa_quantity = quantity
+        self._soa_cost = cost
+        self._soa_dirty = False
+
+    def _gather_marks(self, prices: Mapping[str, float]) -> tuple[Any, Any, Any]:
+        """Return (quantity, cost, mark price) arrays for current positions."""
+        if self._soa_dirty:
+            self._refresh_soa()
+
+        symbols = self._soa_symbols
+        cost = self._soa_cost
+        if not symbols:
+            return self._soa_quantity, cost, cost
+
+        get = prices.get
+        marks = np.fromiter(
+            (get(symbol, cost[index]) for index, symbol in enumerate(symbols)),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+        return self._soa_quantity, cost, marks
+
     def settle_day(self, date: date) -> None:
         """Perform day-end settlement.
 
@@ -170,29 +293,28 @@ class Portfolio:
         if self.trade_mode != "T+1":
             return
 
-        released = self._pending_t1.pop(date, {})
+        released = self._pending_t1.pop(date, None)
+        if not released:
+            return
+
         for symbol, qty in released.items():
             position = self.positions.get(symbol)
             if position is not None:
                 position.available += qty
 
-    def get_position_ratios(self, prices: dict[str, float]) -> dict[str, float]:
+    def get_position_ratios(self, prices: Mapping[str, float]) -> dict[str, float]:
         """Return each position's market value ratio to total assets."""
         total_value = self.get_total_value(prices)
         if total_value <= 0:
             return {symbol: 0.0 for symbol in self.positions}
 
+        if np is not None:
+            quantity, _, marks = self._gather_marks(prices)
+            ratios_arr = (quantity * marks) / total_value
+            return dict(zip(self._soa_symbols, ratios_arr.tolist()))
+
         ratios: dict[str, float] = {}
         for symbol, position in self.positions.items():
             market_price = prices.get(symbol, position.cost)
             ratios[symbol] = (position.quantity * market_price) / total_value
         return ratios
-
-    @staticmethod
-    def _validate_trade_input(symbol: str, quantity: int, price: float) -> None:
-        if not symbol:
-            raise ValueError("symbol must not be empty")
-        if quantity <= 0:
-            raise ValueError("quantity must be positive")
-        if price <= 0:
-            raise ValueError("price must be positive")
@@ -2,12 +2,80 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import sys
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Mapping
+from typing import Any, Mapping, Sequence
 
 from .portfolio import Portfolio, Position
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_NUMBA = False
+
+
+# Canonical side singletons: _read_order_side funnels every equal string
+# through this table, so rules can compare sides by identity.
+_BUY = sys.intern("BUY")
+_SELL = sys.intern("SELL")
+_SIDES = {"BUY": _BUY, "SELL": _SELL, "buy": _BUY, "sell": _SELL}
+
+# Shared no-violation result: rules return this singleton instead of
+# allocating a fresh empty list on every clean check.
+_EMPTY: tuple[str, ...] = ()
+
+
+def _ratio_violation(
+    total_value: float,
+    current_value: float,
+    quantity: float,
+    price: float,
+    max_ratio: float,
+) -> bool:
+    """Arithmetic core of the position-ratio check.
+
+    Kept as a module-level scalar kernel so Numba can lower it to native
+    code when available; the pure-Python form is the fallback.
+    """
+    return (current_value + quantity * price) / total_value > max_ratio
+
+
+if _HAS_NUMBA:
+    _ratio_violation = njit(cache=True, fastmath=True)(_ratio_violation)
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedOrder:
+    """Validated, immutable view of an order mapping.
+
+    Parsed once per :meth:`RiskManager.check_order` so individual rules
+    read plain attributes instead of re-running dict lookups and
+    isinstance validation per rule.
+    """
+
+    symbol: str
+    quantity: int
+    price: float
+    side: str
+
+    @classmethod
+    def from_mapping(cls, order: Mapping[str, object]) -> "ParsedOrder":
+        """Parse and validate a raw order mapping."""
+        return cls(
+            symbol=_read_order_symbol(order),
+            quantity=_read_order_quantity(order),
+            price=_read_order_price(order),
+            side=_read_order_side(order),
+        )
+
 
 @dataclass(slots=True)
 class RiskCheckResult:
@@ -22,84 +90,127 @@ class RiskCheckResult:
     violations: list[str] = field(default_factory=list)
 
 
-class RiskRule(ABC):
-    """Abstract base class for all risk rules."""
+class RiskRule:
+    """Base class describing the risk-rule interface.
+
+    A plain class rather than an ABC: rules are duck-typed through
+    ``RiskManager`` and nothing isinstance-checks them, so ABCMeta's
+    instantiation and registration overhead buys nothing here.
+    Subclasses override the check methods they care about.
+    """
+
+    __slots__ = ()
+
+    # Sides this rule can ever flag; the manager skips the rule entirely
+    # for orders outside the set, saving the call on e.g. SELL-heavy
+    # streams for BUY-gated rules.
+    applies_to_side: frozenset[str] = frozenset({_BUY, _SELL})
 
-    @abstractmethod
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
-        """Validate an order against this rule and return violations."""
+    ) -> Sequence[str]:
+        """Validate a parsed order against this rule and return violations."""
+        raise NotImplementedError
 
-    @abstractmethod
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
+    ) -> Sequence[str]:
         """Validate an existing position against this rule and return violations."""
+        raise NotImplementedError
+
+    def check_positions_vec(self, cost: Any, price: Any) -> Any:
+        """Return a boolean violation mask over position arrays, or ``None``.
+
+        Rules whose trigger is a pure cost/price comparison override this
+        with a single NumPy compare; ``None`` means the rule has no
+        vectorized path and the caller falls back to per-symbol calls.
+        """
+        _ = (cost, price)
+        return None
 
 
 class StopLossRule(RiskRule):
     """Trigger violation when current price falls below stop-loss threshold."""
 
+    __slots__ = ("stop_loss_pct", "_factor")
+
     def __init__(self, stop_loss_pct: float) -> None:
         if not 0 < stop_loss_pct < 1:
             raise ValueError("stop_loss_pct must be between 0 and 1")
         self.stop_loss_pct = stop_loss_pct
+        # Invariant trigger factor, folded once instead of per check.
+        self._factor = 1.0 - stop_loss_pct
 
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (order, portfolio, prices)
-        return []
+        return _EMPTY
 
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
-        trigger_price = position.cost * (1 - self.stop_loss_pct)
+    ) -> Sequence[str]:
+        trigger_price = position.cost * self._factor
         if price <= trigger_price:
             return [
                 f"Stop loss triggered for {symbol}: price {price:.4f} <= {trigger_price:.4f}"
             ]
-        return []
+        return _EMPTY
+
+    def check_positions_vec(self, cost: Any, price: Any) -> Any:
+        """Vectorized trigger mask: one compare over all positions."""
+        return price <= cost * self._factor
 
 
 class TakeProfitRule(RiskRule):
     """Trigger violation when current price rises above take-profit threshold."""
 
+    __slots__ = ("take_profit_pct", "_factor")
+
     def __init__(self, take_profit_pct: float) -> None:
         if not 0 < take_profit_pct < 1:
             raise ValueError("take_profit_pct must be between 0 and 1")
         self.take_profit_pct = take_profit_pct
+        # Invariant trigger factor, folded once instead of per check.
+        self._factor = 1.0 + take_profit_pct
 
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (order, portfolio, prices)
-        return []
+        return _EMPTY
 
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
-        trigger_price = position.cost * (1 + self.take_profit_pct)
+    ) -> Sequence[str]:
+        trigger_price = position.cost * self._factor
         if price >= trigger_price:
             return [
                 f"Take profit triggered for {symbol}: price {price:.4f} >= {trigger_price:.4f}"
             ]
-        return []
+        return _EMPTY
+
+    def check_positions_vec(self, cost: Any, price: Any) -> Any:
+        """Vectorized trigger mask: one compare over all positions."""
+        return price >= cost * self._factor
 
 
 class MaxPositionRatioRule(RiskRule):
     """Limit single-symbol market value ratio in total assets."""
 
+    __slots__ = ("max_ratio",)
+
+    applies_to_side = frozenset({_BUY})
+
     def __init__(self, max_ratio: float) -> None:
         if not 0 < max_ratio <= 1:
             raise ValueError("max_ratio must be in (0, 1]")
@@ -107,21 +218,22 @@ class MaxPositionRatioRule(RiskRule):
 
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
-        side = _read_order_side(order)
-        if side != "BUY":
-            return []
+    ) -> Sequence[str]:
+        if order.side is not _BUY:
+            return _EMPTY
 
-        symbol = _read_order_symbol(order)
-        quantity = _read_order_quantity(order)
-        price = _read_order_price(order)
+        symbol = order.symbol
+        quantity = order.quantity
+        price = order.price
 
-        total_value = portfolio.get_total_value(dict(prices))
+        # get_total_value accepts any Mapping and memoizes on (cash, prices),
+        # so no defensive dict copy is needed per order.
+        total_value = portfolio.get_total_value(prices)
         if total_value <= 0:
-            return []
+            return _EMPTY
 
         position = portfolio.get_position(symbol)
         current_quantity = position.quantity if position is not None else 0
@@ -130,28 +242,34 @@ class MaxPositionRatioRule(RiskRule):
         )
         current_value = current_quantity * current_price
 
-        projected_value = current_value + quantity * price
-        ratio = projected_value / total_value
-
-        if ratio > self.max_ratio:
+        if _ratio_violation(
+            total_value, current_value, quantity, price, self.max_ratio
+        ):
+            # Only the (rare) violation path pays for the ratio rebuild
+            # needed by the message.
+            ratio = (current_value + quantity * price) / total_value
             return [
                 (
                     f"Position ratio violation for {symbol}: "
                     f"{ratio:.2%} > max ratio {self.max_ratio:.2%}"
                 )
             ]
-        return []
+        return _EMPTY
 
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (symbol, position, price)
-        return []
+        return _EMPTY
 
 
 class MaxHoldingsRule(RiskRule):
     """Limit the number of distinct symbols held in portfolio."""
 
+    __slots__ = ("max_holdings",)
+
+    applies_to_side = frozenset({_BUY})
+
     def __init__(self, max_holdings: int) -> None:
         if max_holdings <= 0:
             raise ValueError("max_holdings must be positive")
@@ -159,18 +277,16 @@ class MaxHoldingsRule(RiskRule):
 
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = prices
-        side = _read_order_side(order)
-        if side != "BUY":
-            return []
+        if order.side is not _BUY:
+            return _EMPTY
 
-        symbol = _read_order_symbol(order)
-        if symbol in portfolio.positions:
-            return []
+        if order.symbol in portfolio.positions:
+            return _EMPTY
 
         if len(portfolio.positions) >= self.max_holdings:
             return [
@@ -179,18 +295,20 @@ class MaxHoldingsRule(RiskRule):
                     f"limit {self.max_holdings}"
                 )
             ]
-        return []
+        return _EMPTY
 
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (symbol, position, price)
-        return []
+        return _EMPTY
 
 
 class MaxTradeAmountRule(RiskRule):
     """Limit the amount of one single order."""
 
+    __slots__ = ("max_amount",)
+
     def __init__(self, max_amount: float) -> None:
         if max_amount <= 0:
             raise ValueError("max_amount must be positive")
@@ -198,38 +316,74 @@ class MaxTradeAmountRule(RiskRule):
 
     def check_order(
         self,
-        order: Mapping[str, object],
+        order: ParsedOrder,
         portfolio: Portfolio,
         prices: Mapping[str, float],
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (portfolio, prices)
-        quantity = _read_order_quantity(order)
-        price = _read_order_price(order)
-
-        amount = quantity * price
+        amount = order.quantity * order.price
         if amount > self.max_amount:
             return [
                 f"Max trade amount violation: amount {amount:.2f} > max trade amount {self.max_amount:.2f}"
             ]
-        return []
+        return _EMPTY
 
     def check_position(
         self, symbol: str, position: Position, price: float
-    ) -> list[str]:
+    ) -> Sequence[str]:
         _ = (symbol, position, price)
-        return []
+        return _EMPTY
+
+
+# Below this rule count, executor submit/result overhead outweighs any
+# parallelism win, so checks stay serial.
+_PARALLEL_RULE_THRESHOLD = 4
 
 
 class RiskManager:
     """Risk manager that evaluates orders and positions against rules."""
 
-    def __init__(self, rules: list[RiskRule] | None = None) -> None:
+    def __init__(
+        self,
+        rules: list[RiskRule] | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            rules: Initial rule list.
+            executor: Optional executor for fanning out independent rule
+                checks; only used once enough rules are configured.
+        """
         self.rules: list[RiskRule] = list(rules) if rules is not None else []
-        self._violations: list[str] = []
+        self._violations: tuple[str, ...] = _EMPTY
+        self._executor = executor
+        self._compile()
 
     def add_rule(self, rule: RiskRule) -> None:
         """Add one risk rule."""
         self.rules.append(rule)
+        self._compile()
+
+    def _compile(self) -> None:
+        """Rebuild prebound check-method tuples.
+
+        Binding ``rule.check_order``/``rule.check_position`` once per rule
+        change lets the per-order loop iterate plain callables without a
+        method lookup per rule per call.
+        """
+        self._order_checks = tuple(rule.check_order for rule in self.rules)
+        self._position_checks = tuple(rule.check_position for rule in self.rules)
+        # Side-filtered chains let check_order skip rules that can never
+        # flag the order's side; registration order is preserved.
+        self._order_checks_by_side = {
+            side: tuple(
+                rule.check_order
+                for rule in self.rules
+                if side in rule.applies_to_side
+            )
+            for side in (_BUY, _SELL)
+        }
 
     def check_order(
         self,
@@ -238,11 +392,33 @@ class RiskManager:
         prices: Mapping[str, float],
     ) -> RiskCheckResult:
         """Check whether an order passes all configured rules."""
+        parsed = ParsedOrder.from_mapping(order)
         violations: list[str] = []
-        for rule in self.rules:
-            violations.extend(rule.check_order(order, portfolio, prices))
-
-        self._violations = violations
+        checks = self._order_checks_by_side.get(parsed.side, self._order_checks)
+        executor = self._executor
+        if executor is not None and len(checks) >= _PARALLEL_RULE_THRESHOLD:
+            # Rule checks only read portfolio state, but a valuation-cache
+            # miss mutates it (_tpv_key/_tpv_cache and the SoA rebuild in
+            # _refresh_soa), so warm the cache serially first: fanned-out
+            # rules like MaxPositionRatioRule then hit the memoized
+            # read-only path. Latency becomes the slowest rule instead of
+            # the sum.
+            portfolio.get_total_value(prices)
+            futures = [
+                executor.submit(check, parsed, portfolio, prices)
+                for check in checks
+            ]
+            for future in futures:
+                result = future.result()
+                if result:
+                    violations.extend(result)
+        else:
+            for check in checks:
+                result = check(parsed, portfolio, prices)
+                if result:
+                    violations.extend(result)
+
+        self._violations = tuple(violations) if violations else _EMPTY
         return RiskCheckResult(passed=len(violations) == 0, violations=violations)
 
     def check_position(
@@ -250,15 +426,90 @@ class RiskManager:
     ) -> RiskCheckResult:
         """Check whether a position triggers stop-loss/take-profit rules."""
         violations: list[str] = []
-        for rule in self.rules:
-            violations.extend(rule.check_position(symbol, position, price))
+        for check in self._position_checks:
+            result = check(symbol, position, price)
+            if result:
+                violations.extend(result)
 
-        self._violations = violations
+        self._violations = tuple(violations) if violations else _EMPTY
         return RiskCheckResult(passed=len(violations) == 0, violations=violations)
 
-    def get_violations(self) -> list[str]:
-        """Get latest violation messages."""
-        return list(self._violations)
+    def check_positions(
+        self, positions: Mapping[str, Position], prices: Mapping[str, float]
+    ) -> RiskCheckResult:
+        """Check all holdings in one pass.
+
+        Rules exposing ``check_positions_vec`` are evaluated as a single
+        NumPy comparison over cost/price arrays; violation messages are
+        formatted only for the (rare) triggered symbols. Rules without a
+        vectorized path fall back to per-symbol ``check_position`` calls.
+        """
+        violations: list[str] = []
+
+        if np is None or len(positions) < 2:
+            for symbol, position in positions.items():
+                price = prices.get(symbol, position.cost)
+                for rule in self.rules:
+                    violations.extend(rule.check_position(symbol, position, price))
+            self._violations = tuple(violations) if violations else _EMPTY
+            return RiskCheckResult(passed=not violations, violations=violations)
+
+        symbols = list(positions)
+        count = len(symbols)
+        cost = np.fromiter(
+            (position.cost for position in positions.values()),
+            dtype=np.float64,
+            count=count,
+        )
+        price_arr = np.fromiter(
+            (
+                prices.get(symbol, cost[index])
+                for index, symbol in enumerate(symbols)
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+
+        vec_rules: list[RiskRule] = []
+        masks: list[Any] = []
+        for rule in self.rules:
+            mask = rule.check_positions_vec(cost, price_arr)
+            if mask is None:
+                for index, symbol in enumerate(symbols):
+                    violations.extend(
+                        rule.check_position(
+                            symbol, positions[symbol], float(price_arr[index])
+                        )
+                    )
+                continue
+            vec_rules.append(rule)
+            masks.append(mask)
+
+        if masks:
+            # Aggregate all rule masks first: one bit-parallel reduce plus
+            # a single flatnonzero pass finds the violating symbols, and
+            # only those rows re-enter Python for message formatting.
+            triggered = np.logical_or.reduce(masks)
+            for index in np.flatnonzero(triggered):
+                symbol = symbols[index]
+                position = positions[symbol]
+                price = float(price_arr[index])
+                for rule_index, rule in enumerate(vec_rules):
+                    if masks[rule_index][index]:
+                        violations.extend(
+                            rule.check_position(symbol, position, price)
+                        )
+
+        self._violations = tuple(violations) if violations else _EMPTY
+        return RiskCheckResult(passed=not violations, violations=violations)
+
+    def get_violations(self) -> tuple[str, ...]:
+        """Get latest violation messages as an immutable tuple.
+
+        Returned directly without copying; callers needing mutation
+        should build their own list.
+        """
+        return self._violations
 
 
 def _read_order_symbol(order: Mapping[str, object]) -> str:
@@ -290,7 +541,11 @@ def _read_order_price(order: Mapping[str, object]) -> float:
 
 
 def _read_order_side(order: Mapping[str, object]) -> str:
-    raw = order.get("side", "BUY")
+    raw = order.get("side", _BUY)
     if not isinstance(raw, str) or raw == "":
         raise ValueError("order.side must be non-empty string")
-    return raw.upper()
+    canonical = _SIDES.get(raw)
+    if canonical is not None:
+        return canonical
+    upper = raw.upper()
+    return _SIDES.get(upper, upper)
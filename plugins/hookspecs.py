@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any, ParamSpec, TypeVar, cast
+from typing import Any, ParamSpec, TypeVar
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -81,6 +81,9 @@ def hookimpl(
     def decorator(target: Callable[P, R]) -> Callable[P, R]:
         setattr(target, "__hookimpl__", True)
         setattr(target, "__hookimpl_opts__", {"priority": priority})
+        # Flat int attribute for registration hot path; the opts dict
+        # above stays as the introspectable form.
+        setattr(target, "__hookimpl_priority__", int(priority))
         return target
 
     if func is None:
@@ -113,16 +116,26 @@ class HookCaller:
         self.first_result = first_result
         self.optional = optional
         self._implementations: list[_RegisteredHookImpl] = []
+        self._sorted = True
 
     def register(self, func: Callable[..., Any]) -> None:
-        """Register one hook implementation function."""
-        opts = cast(dict[str, Any], getattr(func, "__hookimpl_opts__", {}))
-        priority = int(opts.get("priority", 0))
+        """Register one hook implementation function.
+
+        Sorting is deferred to the first call so bulk registration at
+        import time stays O(N) instead of O(N^2 log N).
+        """
+        priority = getattr(func, "__hookimpl_priority__", 0)
         self._implementations.append(_RegisteredHookImpl(func=func, priority=priority))
-        self._implementations.sort(key=lambda impl: impl.priority, reverse=True)
+        self._sorted = False
 
     def call(self, *args: Any, **kwargs: Any) -> Any:
         """Invoke all registered implementations according to caller mode."""
+        if not self._sorted:
+            # Stable sort keeps registration order for equal priorities,
+            # matching the previous sort-on-register behavior.
+            self._implementations.sort(key=lambda impl: impl.priority, reverse=True)
+            self._sorted = True
+
         if not self._implementations:
             if self.optional:
                 return None if self.first_result else []
@@ -6,12 +6,26 @@ management, and hook dispatching for framework plugins.
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Any
+from typing import Any, Callable
 
 from core.context import Context
 
 from .base import Plugin
+from .hookspecs import HookCaller
+from .specs import QuantHookSpec
+
+
+def _collect_spec_options() -> dict[str, dict[str, Any]]:
+    """Collect hookspec options from the built-in spec class."""
+    options: dict[str, dict[str, Any]] = {}
+    for attr_name in dir(QuantHookSpec):
+        method = getattr(QuantHookSpec, attr_name, None)
+        if getattr(method, "__hookspec__", False):
+            options[attr_name] = getattr(method, "__hookspec_opts__", {})
+    return options
+
+
+_SPEC_OPTIONS = _collect_spec_options()
 
 
 class PluginManager:
@@ -22,6 +36,12 @@ class PluginManager:
         self._plugins: dict[str, Plugin] = {}
         self._initialized: bool = False
         self._init_order: list[str] = []
+        # Per-hook bound-method lists, resolved lazily on first call and
+        # invalidated whenever the plugin set changes.
+        self._hook_cache: dict[str, list[Callable[..., Any]]] = {}
+        # HookCaller registry for @hookimpl-decorated methods; discovery
+        # happens once per register instead of per call.
+        self._hook_callers: dict[str, HookCaller] = {}
 
     def register(self, plugin: Plugin) -> None:
         """Register a plugin instance.
@@ -35,6 +55,8 @@ class PluginManager:
         if plugin.name in self._plugins:
             raise ValueError(f"Plugin already registered: {plugin.name}")
         self._plugins[plugin.name] = plugin
+        self._hook_cache.clear()
+        self._register_hook_impls(plugin)
 
     def unregister(self, name: str) -> None:
         """Unregister plugin by name.
@@ -43,6 +65,32 @@ class PluginManager:
             name: Plugin name.
         """
         self._plugins.pop(name, None)
+        self._hook_cache.clear()
+        # HookCaller has no unregister; rebuild from remaining plugins.
+        self._hook_callers.clear()
+        for plugin in self._plugins.values():
+            self._register_hook_impls(plugin)
+
+    def _register_hook_impls(self, plugin: Plugin) -> None:
+        """Scan a plugin class once for @hookimpl-marked methods."""
+        seen: set[str] = set()
+        for klass in type(plugin).__mro__:
+            for attr_name, attr in vars(klass).items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                if not getattr(attr, "__hookimpl__", False):
+                    continue
+                caller = self._hook_callers.get(attr_name)
+                if caller is None:
+                    opts = _SPEC_OPTIONS.get(attr_name, {})
+                    caller = HookCaller(
+                        name=attr_name,
+                        first_result=bool(opts.get("first_result", False)),
+                        optional=bool(opts.get("optional", False)),
+                    )
+                    self._hook_callers[attr_name] = caller
+                caller.register(getattr(plugin, attr_name))
 
     def get(self, name: str) -> Plugin | None:
         """Get plugin by name."""
@@ -65,9 +113,6 @@ class PluginManager:
         if self._initialized:
             return
 
-        self._check_dependencies()
-        self._detect_cycles()
-
         order = self._resolve_order()
         for name in order:
             self._plugins[name].setup(context)
@@ -91,66 +136,46 @@ class PluginManager:
         self._init_order = []
 
     def _resolve_order(self) -> list[str]:
-        """Resolve plugin initialization order using topological sort."""
-        graph: dict[str, list[str]] = {name: [] for name in self._plugins}
-        indegree: dict[str, int] = {name: 0 for name in self._plugins}
-
-        for plugin_name, plugin in self._plugins.items():
-            for dependency in plugin.dependencies:
-                graph[dependency].append(plugin_name)
-                indegree[plugin_name] += 1
-
-        queue: deque[str] = deque(name for name in self._plugins if indegree[name] == 0)
-        order: list[str] = []
-
-        while queue:
-            current = queue.popleft()
-            order.append(current)
-
-            for neighbor in graph[current]:
-                indegree[neighbor] -= 1
-                if indegree[neighbor] == 0:
-                    queue.append(neighbor)
-
-        if len(order) != len(self._plugins):
-            raise ValueError("Dependency cycle detected")
+        """Resolve plugin initialization order using topological sort.
 
-        return order
+        Missing dependencies are reported while building the graph and
+        cycles surface from the sort itself (unprocessed nodes remain),
+        so dependency validation needs no separate graph passes.
+        """
+        names = list(self._plugins)
+        index_of = {name: index for index, name in enumerate(names)}
+        count = len(names)
+        indegree = [0] * count
+        adjacency: list[list[int]] = [[] for _ in range(count)]
 
-    def _check_dependencies(self) -> None:
-        """Validate all plugin dependencies are registered."""
-        for plugin in self._plugins.values():
+        for plugin_index, plugin in enumerate(self._plugins.values()):
             for dependency in plugin.dependencies:
-                if dependency not in self._plugins:
+                dependency_index = index_of.get(dependency)
+                if dependency_index is None:
                     raise ValueError(
-                        f"Missing dependency for '{plugin.name}': '{dependency}'"
+                        f"Missing dependency for '{names[plugin_index]}': "
+                        f"'{dependency}'"
                     )
+                adjacency[dependency_index].append(plugin_index)
+                indegree[plugin_index] += 1
+
+        # The processed prefix of `order` doubles as the FIFO queue: a
+        # moving head index replaces deque allocation, and registration
+        # order is preserved among independent plugins.
+        order = [index for index in range(count) if indegree[index] == 0]
+        head = 0
+        while head < len(order):
+            current = order[head]
+            head += 1
+            for neighbor in adjacency[current]:
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:
+                    order.append(neighbor)
 
-    def _detect_cycles(self) -> None:
-        """Detect circular dependencies.
+        if len(order) != count:
+            raise ValueError("Dependency cycle detected")
 
-        Raises:
-            ValueError: If a dependency cycle is found.
-        """
-        visiting: set[str] = set()
-        visited: set[str] = set()
-
-        def dfs(name: str) -> None:
-            if name in visiting:
-                raise ValueError("Dependency cycle detected")
-            if name in visited:
-                return
-
-            visiting.add(name)
-            plugin = self._plugins[name]
-            for dep in plugin.dependencies:
-                dfs(dep)
-            visiting.remove(name)
-            visited.add(name)
-
-        for name in self._plugins:
-            if name not in visited:
-                dfs(name)
+        return [names[index] for index in order]
 
     def call_hook(self, hook_name: str, *args: Any, **kwargs: Any) -> list[Any]:
         """Call the named hook on every plugin and collect results.
@@ -161,13 +186,39 @@ class PluginManager:
             **kwargs: Keyword hook arguments.
 
         Returns:
-            Hook return values from plugins that implement the hook.
+            Hook return values as a list. When any implementation is
+            @hookimpl-decorated, decorated implementations run first in
+            priority order via :class:`HookCaller`, followed by plain
+            (undecorated) implementations in registration order. For
+            ``first_result`` specs the first non-``None`` value is
+            returned as a one-element list, or an empty list when no
+            implementation produced a value.
         """
-        results: list[Any] = []
-
-        for plugin in self._plugins.values():
-            hook = getattr(plugin, hook_name, None)
-            if callable(hook):
-                results.append(hook(*args, **kwargs))
-
+        # Plain (undecorated) implementations, resolved lazily and cached;
+        # decorated methods are excluded so they never run twice.
+        plain = self._hook_cache.get(hook_name)
+        if plain is None:
+            plain = []
+            for plugin in self._plugins.values():
+                hook = getattr(plugin, hook_name, None)
+                if callable(hook) and not getattr(hook, "__hookimpl__", False):
+                    plain.append(hook)
+            self._hook_cache[hook_name] = plain
+
+        caller = self._hook_callers.get(hook_name)
+        if caller is None:
+            return [hook(*args, **kwargs) for hook in plain]
+
+        if caller.first_result:
+            result = caller.call(*args, **kwargs)
+            if result is not None:
+                return [result]
+            for hook in plain:
+                result = hook(*args, **kwargs)
+                if result is not None:
+                    return [result]
+            return []
+
+        results = list(caller.call(*args, **kwargs))
+        results.extend(hook(*args, **kwargs) for hook in plain)
         return results
@@ -18,6 +18,8 @@ def main():
     from contrib.data.akshare_source import AKShareDataSource
 
     data_source = AKShareDataSource()
+    # 后台线程预热并定期刷新可转债列表缓存，后续访问直接命中内存
+    data_source.start_background_refresh()
     try:
         cb_list = data_source.fetch_cb_list()
         print(f"✅ 获取到 {len(cb_list)} 只可转债")
@@ -34,41 +36,52 @@ def main():
     base_prices = {"123001": 100, "123002": 105, "123003": 95, "123004": 110, "123005": 98}
     premium_rates = {"123001": 0.10, "123002": 0.05, "123003": 0.15, "123004": 0.02, "123005": 0.08}
 
-    historical_data = []
     start_date = date(2024, 1, 2)
 
-    import random
-    random.seed(42)  # 可重复
-
-    for day_offset in range(10):
-        current_date = start_date + timedelta(days=day_offset)
-        if current_date.weekday() >= 5:  # 跳过周末
-            continue
-
-        cb_snapshot = []
-        for symbol in symbols:
-            base = base_prices[symbol]
-            # 模拟价格波动
-            change = random.uniform(-0.02, 0.03)
-            close_price = base * (1 + change * (day_offset + 1))
-
-            bar = {
-                "date": current_date.isoformat(),
-                "symbol": symbol,
-                "code": symbol,
-                "price": close_price,
-                "open": close_price * 0.99,
-                "high": close_price * 1.01,
-                "low": close_price * 0.98,
-                "close": close_price,
-                "volume": random.randint(1000000, 5000000),
-                "premium_rate": premium_rates[symbol],
-                "maturity_date": "2028-01-01",
-            }
-            historical_data.append(bar)
-            cb_snapshot.append(bar)
-
-    print(f"✅ 生成 {len(historical_data)} 条历史数据")
+    import numpy as np
+    import pandas as pd
+
+    # 预计算交易日历：一次 bdate_range 调用替代逐日 weekday() 判断，
+    # 后续数组与循环只覆盖交易日，不再浪费周末迭代
+    bdays = pd.bdate_range(start_date, start_date + timedelta(days=9)).date
+    n_days = len(bdays)
+
+    # 批量生成整个 天×券 网格的随机扰动与成交量：
+    # 一次 PRNG 调用替代逐格 random.uniform/randint 的解释器往返
+    rng = np.random.default_rng(42)  # 可重复
+    changes = rng.uniform(-0.02, 0.03, (n_days, len(symbols)))
+    volumes = rng.integers(1_000_000, 5_000_001, (n_days, len(symbols)))
+
+    # 价格路径按 SoA 向量化：close 及 open/high/low 均为一次数组运算
+    base_arr = np.array([base_prices[symbol] for symbol in symbols], dtype=np.float64)
+    day_scale = np.arange(1, n_days + 1, dtype=np.float64)
+    closes = base_arr[None, :] * (1 + changes * day_scale[:, None])
+    opens = closes * 0.99
+    highs = closes * 1.01
+    lows = closes * 0.98
+
+    # 惰性按交易日数组行重建字典：引擎单遍消费，峰值内存只有当前 bar
+    def _iter_bars():
+        for day_index, current_date in enumerate(bdays):
+            date_str = current_date.isoformat()
+            for sym_index, symbol in enumerate(symbols):
+                close_price = float(closes[day_index, sym_index])
+                yield {
+                    "date": date_str,
+                    "symbol": symbol,
+                    "code": symbol,
+                    "price": close_price,
+                    "open": float(opens[day_index, sym_index]),
+                    "high": float(highs[day_index, sym_index]),
+                    "low": float(lows[day_index, sym_index]),
+                    "close": close_price,
+                    "volume": int(volumes[day_index, sym_index]),
+                    "premium_rate": premium_rates[symbol],
+                    "maturity_date": "2028-01-01",
+                }
+
+    bar_count = n_days * len(symbols)
+    print(f"✅ 准备 {bar_count} 条历史数据（惰性生成）")
 
     # 3. 初始化策略
     print("\n[3] 初始化双低策略")
@@ -107,7 +120,7 @@ def main():
     try:
         result = engine.run(
             strategy=strategy,
-            data=historical_data,
+            data=_iter_bars(),
             start_date=start_date,
             end_date=start_date + timedelta(days=14),
         )
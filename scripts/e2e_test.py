@@ -65,17 +65,22 @@ def main():
     engine = SimpleBacktestEngine(initial_cash=100000, trade_mode="T+0", commission_rate=0.0003)
     
     # 简单买入持有策略测试
+    from contrib.strategy.double_low import Signal
+
     class SimpleStrategy:
         def on_init(self, context):
             pass
         def on_bar(self, context, bar):
-            from contrib.strategy.double_low import Signal
-            # 兼容聚合模式：从 cb_data 获取数据
-            cb_data = bar.get("cb_data", [bar])
+            # 兼容聚合模式：从 cb_data 获取数据。
+            # 聚合 bar 恒有 date/cb_data 键，[] 命中时跳过 .get 的默认值构造
+            try:
+                cb_data = bar["cb_data"]
+            except KeyError:
+                cb_data = [bar]
             first_record = cb_data[0] if cb_data else bar
-            bar_date = bar.get("date", "")
-            close_price = first_record.get("close", 100)
-            
+            bar_date = bar["date"] if "date" in bar else ""
+            close_price = first_record["close"] if "close" in first_record else 100
+
             # 第一天买入
             if bar_date == "2024-01-02":
                 return [Signal(symbol="123001", direction="BUY", quantity=100, price=close_price)]
@@ -5,6 +5,7 @@ All tests use mocks and do not call real AKShare APIs.
 
 from __future__ import annotations
 
+import functools
 import importlib.util
 import sys
 import time
@@ -20,6 +21,10 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 PLUGIN_PATH = PROJECT_ROOT / "contrib" / "data" / "akshare_source.py"
 
 
+# Loaded once per process: every test builds a fresh AKShareDataSource
+# (so caches do not leak) and assigns module.ak before exercising it, so
+# re-executing the plugin source per test only burned compile time.
+@functools.lru_cache(maxsize=1)
 def _load_plugin_module() -> ModuleType:
     spec = importlib.util.spec_from_file_location("day8_akshare_source", PLUGIN_PATH)
     if spec is None or spec.loader is None:
@@ -36,20 +41,89 @@ def _build_fake_frame(records: list[dict[str, Any]]) -> Any:
     return frame
 
 
+# Shared fake frames, built once at import: the plugin copies each record
+# on read (_to_records), so tests can reuse them freely. Per-test Mock
+# wrappers stay so call assertions remain isolated.
+_CB_LIST_FRAME = _build_fake_frame(
+    [
+        {"代码": "110001", "名称": "南山转债"},
+        {"代码": "113001", "名称": "平安转债"},
+    ]
+)
+
+_SPOT_FRAME = _build_fake_frame(
+    [
+        {"代码": "110001", "最新价": 101.2},
+        {"代码": "113001", "最新价": 99.8},
+    ]
+)
+
+_CB_HISTORY_FRAME = _build_fake_frame(
+    [
+        {
+            "日期": "2026-01-02",
+            "开盘": 100,
+            "最高": 102,
+            "最低": 99,
+            "收盘": 101,
+            "成交量": 10000,
+            "成交额": 1234567,
+        }
+    ]
+)
+
+_CB_HISTORY_RANGE_FRAME = _build_fake_frame(
+    [
+        {
+            "日期": "2026-01-01",
+            "开盘": 100,
+            "最高": 102,
+            "最低": 99,
+            "收盘": 101,
+            "成交量": 10000,
+            "成交额": 1234567,
+        },
+        {
+            "日期": "2026-01-05",
+            "开盘": 101,
+            "最高": 103,
+            "最低": 100,
+            "收盘": 102,
+            "成交量": 11000,
+            "成交额": 1334567,
+        },
+        {
+            "日期": "2026-01-10",
+            "开盘": 102,
+            "最高": 104,
+            "最低": 101,
+            "收盘": 103,
+            "成交量": 12000,
+            "成交额": 1434567,
+        },
+    ]
+)
+
+_STOCK_DAILY_FRAME = _build_fake_frame(
+    [
+        {
+            "日期": "2026-01-03",
+            "开盘": 10,
+            "最高": 11,
+            "最低": 9.5,
+            "收盘": 10.5,
+            "成交量": 200000,
+            "成交额": 3000000,
+        }
+    ]
+)
+
+
 def test_fetch_cb_list_returns_records() -> None:
     module = _load_plugin_module()
     source = module.AKShareDataSource()
 
-    mock_ak = SimpleNamespace(
-        bond_zh_cov=Mock(
-            return_value=_build_fake_frame(
-                [
-                    {"代码": "110001", "名称": "南山转债"},
-                    {"代码": "113001", "名称": "平安转债"},
-                ]
-            )
-        )
-    )
+    mock_ak = SimpleNamespace(bond_zh_cov=Mock(return_value=_CB_LIST_FRAME))
     module.ak = mock_ak
 
     rows = source.fetch_cb_list()
@@ -63,16 +137,7 @@ def test_fetch_cb_realtime_filters_codes() -> None:
     module = _load_plugin_module()
     source = module.AKShareDataSource()
 
-    mock_ak = SimpleNamespace(
-        bond_zh_hs_cov_spot=Mock(
-            return_value=_build_fake_frame(
-                [
-                    {"代码": "110001", "最新价": 101.2},
-                    {"代码": "113001", "最新价": 99.8},
-                ]
-            )
-        )
-    )
+    mock_ak = SimpleNamespace(bond_zh_hs_cov_spot=Mock(return_value=_SPOT_FRAME))
     module.ak = mock_ak
 
     rows = source.fetch_cb_realtime(["110001"])
@@ -86,21 +151,7 @@ def test_fetch_cb_history_returns_normalized_bars() -> None:
     source = module.AKShareDataSource()
 
     mock_ak = SimpleNamespace(
-        bond_zh_hs_cov_daily=Mock(
-            return_value=_build_fake_frame(
-                [
-                    {
-                        "日期": "2026-01-02",
-                        "开盘": 100,
-                        "最高": 102,
-                        "最低": 99,
-                        "收盘": 101,
-                        "成交量": 10000,
-                        "成交额": 1234567,
-                    }
-                ]
-            )
-        )
+        bond_zh_hs_cov_daily=Mock(return_value=_CB_HISTORY_FRAME)
     )
     module.ak = mock_ak
 
@@ -117,39 +168,7 @@ def test_fetch_cb_history_filters_by_date_range() -> None:
     source = module.AKShareDataSource()
 
     mock_ak = SimpleNamespace(
-        bond_zh_hs_cov_daily=Mock(
-            return_value=_build_fake_frame(
-                [
-                    {
-                        "日期": "2026-01-01",
-                        "开盘": 100,
-                        "最高": 102,
-                        "最低": 99,
-                        "收盘": 101,
-                        "成交量": 10000,
-                        "成交额": 1234567,
-                    },
-                    {
-                        "日期": "2026-01-05",
-                        "开盘": 101,
-                        "最高": 103,
-                        "最低": 100,
-                        "收盘": 102,
-                        "成交量": 11000,
-                        "成交额": 1334567,
-                    },
-                    {
-                        "日期": "2026-01-10",
-                        "开盘": 102,
-                        "最高": 104,
-                        "最低": 101,
-                        "收盘": 103,
-                        "成交量": 12000,
-                        "成交额": 1434567,
-                    },
-                ]
-            )
-        )
+        bond_zh_hs_cov_daily=Mock(return_value=_CB_HISTORY_RANGE_FRAME)
     )
     module.ak = mock_ak
 
@@ -159,27 +178,31 @@ def test_fetch_cb_history_filters_by_date_range() -> None:
     assert bars[0]["datetime"].date() == date(2026, 1, 5)
 
 
-def test_fetch_stock_daily_returns_normalized_bars() -> None:
+def test_fetch_cb_history_bulk_collects_per_symbol_results() -> None:
     module = _load_plugin_module()
     source = module.AKShareDataSource()
 
-    mock_ak = SimpleNamespace(
-        stock_zh_a_hist=Mock(
-            return_value=_build_fake_frame(
-                [
-                    {
-                        "日期": "2026-01-03",
-                        "开盘": 10,
-                        "最高": 11,
-                        "最低": 9.5,
-                        "收盘": 10.5,
-                        "成交量": 200000,
-                        "成交额": 3000000,
-                    }
-                ]
-            )
-        )
+    def _daily(symbol: str) -> Any:
+        if symbol == "bad":
+            raise ValueError("boom")
+        return _CB_HISTORY_FRAME
+
+    module.ak = SimpleNamespace(bond_zh_hs_cov_daily=Mock(side_effect=_daily))
+
+    results = source.fetch_cb_history_bulk(
+        ["110001", "bad"], date(2026, 1, 1), date(2026, 1, 10)
     )
+
+    assert set(results) == {"110001", "bad"}
+    assert results["bad"] == []
+    assert results["110001"][0]["close"] == 101.0
+
+
+def test_fetch_stock_daily_returns_normalized_bars() -> None:
+    module = _load_plugin_module()
+    source = module.AKShareDataSource()
+
+    mock_ak = SimpleNamespace(stock_zh_a_hist=Mock(return_value=_STOCK_DAILY_FRAME))
     module.ak = mock_ak
 
     bars = source.fetch_stock_daily("600000", date(2026, 1, 1), date(2026, 1, 31))
@@ -240,6 +263,28 @@ def test_cache_hit_skips_api_call() -> None:
     mock_ak.bond_zh_cov.assert_called_once_with()
 
 
+def test_background_refresh_warms_cache() -> None:
+    module = _load_plugin_module()
+    source = module.AKShareDataSource()
+
+    mock_ak = SimpleNamespace(bond_zh_cov=Mock(return_value=_CB_LIST_FRAME))
+    module.ak = mock_ak
+
+    source.start_background_refresh(interval_s=60.0)
+    try:
+        key = source._cache.cache_key("cb_list")
+        deadline = time.perf_counter() + 2.0
+        while source._cache.get(key) is None and time.perf_counter() < deadline:
+            time.sleep(0.01)
+
+        rows = source.fetch_cb_list()
+    finally:
+        source.stop_background_refresh()
+
+    assert len(rows) == 2
+    mock_ak.bond_zh_cov.assert_called_once_with()
+
+
 def test_api_error_raises_runtime_error() -> None:
     module = _load_plugin_module()
     source = module.AKShareDataSource()
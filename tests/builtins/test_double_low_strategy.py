@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.util
 import logging
 import sys
@@ -20,6 +21,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 STRATEGY_PATH = PROJECT_ROOT / "contrib" / "strategy" / "double_low.py"
 
 
+# Loaded once per process: tests never mutate the module, so re-executing
+# the strategy source per test only burned compile time.
+@functools.lru_cache(maxsize=1)
 def _load_strategy_module() -> ModuleType:
     spec = importlib.util.spec_from_file_location("day9_double_low", STRATEGY_PATH)
     if spec is None or spec.loader is None:
@@ -129,6 +129,57 @@ def test_fetch_stock_history_returns_normalized_bars(
     assert bars[0]["symbol"] == "000001"
 
 
+def test_fetch_stock_history_many_batches_one_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_plugin_module()
+    monkeypatch.setenv("TUSHARE_TOKEN", "token")
+
+    pro = SimpleNamespace(
+        daily=Mock(
+            return_value=_build_fake_frame(
+                [
+                    {
+                        "ts_code": "000001.SZ",
+                        "trade_date": "20260102",
+                        "open": 9.9,
+                        "high": 10.2,
+                        "low": 9.7,
+                        "close": 10.0,
+                        "vol": 180000,
+                        "amount": 2600000,
+                    },
+                    {
+                        "ts_code": "600000.SH",
+                        "trade_date": "20260102",
+                        "open": 7.0,
+                        "high": 7.2,
+                        "low": 6.9,
+                        "close": 7.1,
+                        "vol": 90000,
+                        "amount": 640000,
+                    },
+                ]
+            )
+        )
+    )
+    module.ts = SimpleNamespace(set_token=Mock(), pro_api=Mock(return_value=pro))
+
+    source = module.TushareDataSource()
+    results = source.fetch_stock_history_many(
+        ["000001", "600000"], date(2026, 1, 1), date(2026, 1, 10)
+    )
+
+    assert set(results) == {"000001", "600000"}
+    assert results["000001"][0]["close"] == 10.0
+    assert results["600000"][0]["symbol"] == "600000"
+    pro.daily.assert_called_once()
+
+    # Warm per-symbol cache entries must skip a second RPC.
+    source.fetch_stock_history_many(["000001"], date(2026, 1, 1), date(2026, 1, 10))
+    pro.daily.assert_called_once()
+
+
 def test_fetch_cb_list_returns_records(monkeypatch: pytest.MonkeyPatch) -> None:
     module = _load_plugin_module()
     monkeypatch.setenv("TUSHARE_TOKEN", "token")
@@ -168,3 +168,29 @@ def test_integration_with_simple_backtest_engine() -> None:
     )
 
     assert result.trade_count == 1
+
+
+def test_check_orders_matches_per_order_results() -> None:
+    from contrib.risk.basic_risk_plugin import BasicRiskPlugin
+
+    plugin = BasicRiskPlugin()
+    context = _build_context(initial_cash=100_000)
+    context.portfolio.buy("000002.SZ", quantity=100, price=50.0, date=date(2026, 2, 12))
+
+    orders: list[dict[str, Any]] = [
+        {"symbol": "000001.SZ", "side": "BUY", "quantity": 100, "price": 100.0},
+        {"symbol": "000001.SZ", "side": "BUY", "quantity": 400, "price": 100.0},
+        {"symbol": "000001.SZ", "side": "BUY", "quantity": 300, "price": 100.0},
+        {"symbol": "000002.SZ", "side": "SELL", "quantity": 100, "price": 50.0},
+        {"symbol": "", "side": "BUY", "quantity": 100, "price": 100.0},
+    ]
+
+    batched = plugin.check_orders(orders, context)
+    single = [plugin.check_order(order, context) for order in orders]
+
+    assert [result.passed for result in batched] == [
+        result.passed for result in single
+    ]
+    assert [result.violations for result in batched] == [
+        result.violations for result in single
+    ]
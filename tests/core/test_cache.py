@@ -6,7 +6,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from core.cache import CacheManager, FileCache, MemoryCache
+from core.cache import CacheManager, FileCache, MemoryCache, TieredCache
 
 
 def test_memory_cache_set_and_get() -> None:
@@ -105,6 +105,42 @@ def test_cache_manager_get_or_set_and_cache_key() -> None:
     assert key != manager.cache_key("kline", "000002", "2026-01-01", 20)
 
 
+def test_tiered_cache_reads_through_and_promotes(tmp_path: Path) -> None:
+    """TieredCache should serve back-tier hits and promote them to the front."""
+    front = MemoryCache()
+    back = FileCache(cache_dir=tmp_path)
+    back.set("warm", {"v": 1}, ttl=10)
+
+    cache = TieredCache(front, back)
+
+    assert cache.get("warm") == {"v": 1}
+    assert front.get("warm") == {"v": 1}
+
+
+def test_tiered_cache_write_and_delete_hit_both_tiers(tmp_path: Path) -> None:
+    """TieredCache set/delete should apply to both tiers."""
+    front = MemoryCache()
+    back = FileCache(cache_dir=tmp_path)
+    cache = TieredCache(front, back)
+
+    cache.set("k", 1, ttl=10)
+    assert front.get("k") == 1
+    assert back.get("k") == 1
+
+    cache.delete("k")
+    assert cache.get("k") is None
+    assert back.get("k") is None
+
+
+def test_tiered_cache_persists_across_instances(tmp_path: Path) -> None:
+    """Back tier should survive a fresh front tier (process restart)."""
+    first = TieredCache(MemoryCache(), FileCache(cache_dir=tmp_path))
+    first.set("persist", "v", ttl=10)
+
+    second = TieredCache(MemoryCache(), FileCache(cache_dir=tmp_path))
+    assert second.get("persist") == "v"
+
+
 def test_memory_cache_thread_safety_optional() -> None:
     """MemoryCache should be safe for concurrent set/get workloads."""
     cache = MemoryCache()
@@ -121,3 +157,25 @@ def test_memory_cache_thread_safety_optional() -> None:
         results = list(executor.map(worker, range(100)))
 
     assert results == list(range(100))
+
+
+def test_cache_manager_single_flight_under_concurrency() -> None:
+    """Concurrent misses on one key should invoke the factory only once."""
+    manager = CacheManager(backend=MemoryCache())
+    calls = 0
+
+    def factory() -> int:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return 7
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(manager.get_or_set, "slow", factory, 10)
+            for _ in range(4)
+        ]
+        values = [future.result() for future in futures]
+
+    assert values == [7, 7, 7, 7]
+    assert calls == 1
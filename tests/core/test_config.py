@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
-from core.config import ConfigManager
+from core.config import ConfigManager, invalidate_env_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_env_cache() -> Iterator[None]:
+    """Re-scan QUANT__ env vars around each test's monkeypatching."""
+    invalidate_env_cache()
+    yield
+    invalidate_env_cache()
 
 
 def _write_toml(path: Path, content: str) -> None:
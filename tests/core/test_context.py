@@ -142,3 +142,21 @@ def test_context_data_get_set() -> None:
 
     assert ctx.get("alpha") == "beta"
     assert ctx.get("count") == 7
+
+
+def test_context_mapping_style_access() -> None:
+    """Context should support dict-style item access on its data."""
+    config, portfolio, risk_manager, event_engine, logger = _build_components()
+    context = Context(
+        config=config,
+        portfolio=portfolio,
+        risk_manager=risk_manager,
+        event_engine=event_engine,
+        logger=logger,
+    )
+
+    context["signal"] = {"symbol": "000001"}
+
+    assert "signal" in context
+    assert context["signal"] == {"symbol": "000001"}
+    assert context.get("signal") == {"symbol": "000001"}
@@ -5,7 +5,7 @@ EventEngine 单元测试
 import pytest
 from unittest.mock import Mock, call
 
-from core.engine import Event, EventEngine, EventType, create_engine
+from core.engine import Event, EventEngine, EventType, create_engine, event_mask
 
 
 class TestEvent:
@@ -252,6 +252,44 @@ class TestEventEngine:
         assert "signal: buy" in results
         assert "order: new_order" in results
     
+    def test_put_many(self):
+        """测试批量发送事件"""
+        results = []
+
+        self.engine.register(EventType.BAR, lambda e: results.append(e.data))
+
+        self.engine.start()
+        self.engine.put_many(
+            [Event(EventType.BAR, data=i) for i in range(3)]
+        )
+        self.engine.stop()
+
+        assert results == [0, 1, 2]
+
+    def test_use_filtered_middleware(self):
+        """测试带事件掩码的中间件只处理掩码内事件"""
+        seen = []
+
+        def order_only(event):
+            seen.append(event.type)
+            return event
+
+        self.engine.use_filtered(
+            order_only, event_mask(EventType.ORDER, EventType.TRADE)
+        )
+        handler = Mock()
+        self.engine.register(EventType.BAR, handler)
+        self.engine.register(EventType.ORDER, handler)
+
+        self.engine.start()
+        self.engine.put(Event(EventType.BAR))
+        self.engine.put(Event(EventType.ORDER))
+        self.engine.stop()
+
+        # 掩码外的 BAR 原样透传，两个事件都到达处理器
+        assert seen == [EventType.ORDER]
+        assert handler.call_count == 2
+
     def test_put_when_not_running(self):
         """测试引擎未启动时发送事件"""
         handler = Mock()
@@ -131,3 +131,18 @@ def test_get_position_ratios() -> None:
 
     assert ratios["000001.SZ"] == pytest.approx(1000 / 100000)
     assert ratios["000002.SZ"] == pytest.approx(4000 / 100000)
+
+
+def test_get_total_value_cache_invalidated_by_trades() -> None:
+    """Repeated valuations should stay correct across trades."""
+    portfolio = Portfolio(initial_cash=100_000, trade_mode="T+0")
+    trade_date = date(2026, 2, 12)
+    portfolio.buy("000001.SZ", quantity=100, price=10.0, date=trade_date)
+
+    prices = {"000001.SZ": 10.8}
+    assert portfolio.get_total_value(prices) == pytest.approx(100_080.0)
+    assert portfolio.get_total_value(prices) == pytest.approx(100_080.0)
+
+    portfolio.sell("000001.SZ", quantity=100, price=10.8, date=trade_date)
+    assert portfolio.get_total_value(prices) == pytest.approx(100_080.0)
+    assert portfolio.get_total_value({}) == pytest.approx(100_080.0)
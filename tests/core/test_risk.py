@@ -134,6 +134,55 @@ def test_risk_check_passes_when_all_rules_satisfied() -> None:
     assert result.violations == []
 
 
+def test_check_positions_matches_per_symbol_results() -> None:
+    """Batched position check should agree with per-symbol checks."""
+    portfolio = Portfolio(initial_cash=100_000, trade_mode="T+0")
+    trade_date = date(2026, 2, 12)
+    portfolio.buy("000001.SZ", quantity=100, price=10.0, date=trade_date)
+    portfolio.buy("000002.SZ", quantity=100, price=20.0, date=trade_date)
+    portfolio.buy("000003.SZ", quantity=100, price=30.0, date=trade_date)
+
+    manager = RiskManager(
+        rules=[StopLossRule(stop_loss_pct=0.1), TakeProfitRule(take_profit_pct=0.2)]
+    )
+    prices = {"000001.SZ": 8.5, "000002.SZ": 20.5, "000003.SZ": 37.0}
+
+    batched = manager.check_positions(portfolio.positions, prices)
+
+    expected: list[str] = []
+    for symbol, position in portfolio.positions.items():
+        expected.extend(
+            manager.check_position(symbol, position, prices[symbol]).violations
+        )
+
+    assert batched.passed is False
+    assert sorted(batched.violations) == sorted(expected)
+
+
+def test_check_order_with_executor_matches_serial_results() -> None:
+    """Executor-backed fan-out should produce the same violations."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    rules = [
+        MaxTradeAmountRule(max_amount=20_000),
+        MaxPositionRatioRule(max_ratio=0.3),
+        MaxHoldingsRule(max_holdings=5),
+        StopLossRule(stop_loss_pct=0.1),
+    ]
+    portfolio = Portfolio(initial_cash=100_000, trade_mode="T+0")
+    order = _build_order("000001.SZ", quantity=4000, price=10.0)
+    prices = {"000001.SZ": 10.0}
+
+    serial = RiskManager(rules=rules).check_order(order, portfolio, prices)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = RiskManager(rules=rules, executor=executor).check_order(
+            order, portfolio, prices
+        )
+
+    assert parallel.passed is serial.passed
+    assert parallel.violations == serial.violations
+
+
 def test_risk_blocks_order_and_returns_reason() -> None:
     """When blocked, result should include readable violation reasons."""
     portfolio = Portfolio(initial_cash=100_000, trade_mode="T+0")
@@ -12,6 +12,7 @@ from core.engine import EventEngine
 from core.portfolio import Portfolio
 from core.risk import RiskManager
 from plugins.base import Plugin
+from plugins.hookspecs import hookimpl
 from plugins.manager import PluginManager
 
 
@@ -164,6 +165,70 @@ def test_missing_dependency_detection() -> None:
         manager.initialize(_build_context())
 
 
+def test_call_hook_respects_hookimpl_priority() -> None:
+    """Decorated hook implementations should run in priority order."""
+
+    class _LowPlugin(Plugin):
+        name = "low"
+
+        @hookimpl(priority=1)
+        def on_trade(self, value: int) -> str:
+            return f"low:{value}"
+
+    class _HighPlugin(Plugin):
+        name = "high"
+
+        @hookimpl(priority=10)
+        def on_trade(self, value: int) -> str:
+            return f"high:{value}"
+
+    manager = PluginManager()
+    manager.register(_LowPlugin())
+    manager.register(_HighPlugin())
+
+    assert manager.call_hook("on_trade", 7) == ["high:7", "low:7"]
+
+
+def test_call_hook_merges_decorated_and_plain_implementations() -> None:
+    """Decorated dispatch must not drop undecorated implementations."""
+
+    class _DecoratedPlugin(Plugin):
+        name = "decorated"
+
+        @hookimpl(priority=5)
+        def on_trade(self, value: int) -> str:
+            return f"decorated:{value}"
+
+    class _PlainPlugin(Plugin):
+        name = "plain"
+
+        def on_trade(self, value: int) -> str:
+            return f"plain:{value}"
+
+    manager = PluginManager()
+    manager.register(_PlainPlugin())
+    manager.register(_DecoratedPlugin())
+
+    assert manager.call_hook("on_trade", 3) == ["decorated:3", "plain:3"]
+
+
+def test_call_hook_first_result_returns_single_element_list() -> None:
+    """first_result specs must still return a list from call_hook."""
+
+    class _OrderPlugin(Plugin):
+        name = "order"
+
+        @hookimpl
+        def on_order(self, order: dict[str, object]) -> dict[str, object]:
+            _ = order
+            return {"adjusted": True}
+
+    manager = PluginManager()
+    manager.register(_OrderPlugin())
+
+    assert manager.call_hook("on_order", {}) == [{"adjusted": True}]
+
+
 def test_call_hook_dispatches_to_all_plugins() -> None:
     """PluginManager.call_hook should dispatch hook calls and collect results."""
     manager = PluginManager()